@@ -6,6 +6,14 @@ from github.PullRequestComment import PullRequestComment
 from drift.models import Comment, FileChange, FileStatus, PullRequestInfo
 
 
+FILE_STATUS_BY_GITHUB = {
+    "added": FileStatus.ADDED,
+    "removed": FileStatus.DELETED,
+    "modified": FileStatus.MODIFIED,
+    "renamed": FileStatus.RENAMED,
+}
+
+
 class GitHubMapper:
     @staticmethod
     def to_pull_request_info(pr: PullRequest) -> PullRequestInfo:
@@ -30,17 +38,10 @@ class GitHubMapper:
     @staticmethod
     def to_file_change(file: File) -> FileChange:
         try:
-            status_map = {
-                "added": FileStatus.ADDED,
-                "removed": FileStatus.DELETED,
-                "modified": FileStatus.MODIFIED,
-                "renamed": FileStatus.RENAMED,
-            }
-
             return FileChange(
                 path=file.filename,
                 old_path=getattr(file, "previous_filename", None),
-                status=status_map.get(file.status, FileStatus.MODIFIED),
+                status=FILE_STATUS_BY_GITHUB.get(file.status, FileStatus.MODIFIED),
                 additions=file.additions,
                 deletions=file.deletions,
                 patch=file.patch or "",
@@ -1,8 +1,47 @@
-from typing import TypedDict
+from collections.abc import Mapping
+import re
+from typing import Any, TypedDict
 
 from drift.models import Comment, FileChange, FileStatus, PullRequestInfo
 
 
+ADDED_LINE_PATTERN = re.compile(r"^\+(?!\+\+)", re.MULTILINE)
+DELETED_LINE_PATTERN = re.compile(r"^-(?!--)", re.MULTILINE)
+DRIFT_MARKERS = ("drift", "🌊")
+DRIFT_MARKER_PATTERN = re.compile(
+    "|".join(map(re.escape, DRIFT_MARKERS)), re.IGNORECASE
+)
+
+# Indexed by (new_file << 2) | (deleted_file << 1) | renamed_file, so that
+# new_file takes precedence over deleted_file, which takes precedence over
+# renamed_file.
+FILE_STATUS_BY_GITLAB_FLAGS = (
+    FileStatus.MODIFIED,
+    FileStatus.RENAMED,
+    FileStatus.DELETED,
+    FileStatus.DELETED,
+    FileStatus.ADDED,
+    FileStatus.ADDED,
+    FileStatus.ADDED,
+    FileStatus.ADDED,
+)
+
+MERGE_REQUEST_REQUIRED_KEYS = frozenset(
+    {
+        "iid",
+        "title",
+        "author",
+        "source_branch",
+        "target_branch",
+        "state",
+        "created_at",
+        "updated_at",
+    }
+)
+CHANGE_REQUIRED_KEYS = frozenset({"old_path", "new_path"})
+NOTE_REQUIRED_KEYS = frozenset({"id", "author", "created_at"})
+
+
 class GitLabUser(TypedDict):
     username: str
 
@@ -44,88 +83,115 @@ class GitLabNote(TypedDict):
     position: GitLabPosition | None
 
 
-class GitLabMapper:
-    @staticmethod
-    def to_pull_request_info(mr: GitLabMergeRequest) -> PullRequestInfo:
-        try:
-            return PullRequestInfo(
-                id=str(mr["iid"]),
-                title=mr["title"],
-                description=mr.get("description") or "",
-                author_username=mr["author"]["username"],
-                source_branch=mr["source_branch"],
-                target_branch=mr["target_branch"],
-                state="merged" if mr["state"] == "merged" else mr["state"],
-                is_merged=mr["state"] == "merged",
-                created_at=mr["created_at"],
-                updated_at=mr["updated_at"],
+def _missing_fields(required: frozenset[str], data: Mapping[str, Any]) -> list[str]:
+    missing = sorted(required - data.keys())
+    if "author" in data and "username" not in data["author"]:
+        missing.append("author.username")
+    return missing
+
+
+def to_pull_request_info(mr: GitLabMergeRequest) -> PullRequestInfo:
+    try:
+        missing = _missing_fields(MERGE_REQUEST_REQUIRED_KEYS, mr)
+        if missing:
+            raise ValueError(
+                f"Invalid GitLab merge request data: missing required fields {missing}"
             )
-        except (KeyError, TypeError) as e:
-            raise ValueError(f"Invalid GitLab merge request data: {e}") from e
-
-    @staticmethod
-    def to_file_change(change: GitLabChange) -> FileChange:
-        try:
-            if change.get("new_file"):
-                status = FileStatus.ADDED
-            elif change.get("deleted_file"):
-                status = FileStatus.DELETED
-            elif change.get("renamed_file"):
-                status = FileStatus.RENAMED
-            else:
-                status = FileStatus.MODIFIED
-
-            diff_text = change.get("diff") or ""
-            additions = 0
-            deletions = 0
-
-            for line in diff_text.split("\n"):
-                if line.startswith("+") and not line.startswith("+++"):
-                    additions += 1
-                elif line.startswith("-") and not line.startswith("---"):
-                    deletions += 1
-
-            return FileChange(
+        return PullRequestInfo(
+            id=str(mr["iid"]),
+            title=mr["title"],
+            description=mr.get("description") or "",
+            author_username=mr["author"]["username"],
+            source_branch=mr["source_branch"],
+            target_branch=mr["target_branch"],
+            state="merged" if mr["state"] == "merged" else mr["state"],
+            is_merged=mr["state"] == "merged",
+            created_at=mr["created_at"],
+            updated_at=mr["updated_at"],
+        )
+    except (KeyError, TypeError) as e:
+        raise ValueError(f"Invalid GitLab merge request data: {e}") from e
+
+
+def to_file_change(change: GitLabChange) -> FileChange:
+    return to_file_changes([change])[0]
+
+
+def to_file_changes(changes: list[GitLabChange]) -> list[FileChange]:
+    try:
+        for change in changes:
+            if not CHANGE_REQUIRED_KEYS.issubset(change):
+                raise ValueError(
+                    f"Invalid GitLab file change data: missing required fields "
+                    f"{sorted(CHANGE_REQUIRED_KEYS - change.keys())}"
+                )
+
+        statuses = FILE_STATUS_BY_GITLAB_FLAGS
+        find_added = ADDED_LINE_PATTERN.findall
+        find_deleted = DELETED_LINE_PATTERN.findall
+        diffs = [change.get("diff") or "" for change in changes]
+
+        return [
+            FileChange(
                 path=change["new_path"],
                 old_path=change["old_path"]
                 if change["old_path"] != change["new_path"]
                 else None,
-                status=status,
-                additions=additions,
-                deletions=deletions,
-                patch=change.get("diff") or "",
+                status=statuses[
+                    bool(change.get("new_file")) << 2
+                    | bool(change.get("deleted_file")) << 1
+                    | bool(change.get("renamed_file"))
+                ],
+                additions=len(find_added(diff_text)),
+                deletions=len(find_deleted(diff_text)),
+                patch=diff_text,
             )
-        except (KeyError, TypeError) as e:
-            raise ValueError(f"Invalid GitLab file change data: {e}") from e
-
-    @staticmethod
-    def to_comment(note: GitLabNote) -> Comment:
-        try:
-            position = note.get("position")
-            file_path = None
-            line_from = None
-            line_to = None
-
-            if position:
-                file_path = position.get("new_path") or position.get("old_path")
-                if position.get("new_line"):
-                    line_from = position.get("new_line")
-                    line_to = position.get("new_line")
-                elif position.get("old_line"):
-                    line_from = position.get("old_line")
-                    line_to = position.get("old_line")
-
-            body = note.get("body") or ""
-            return Comment(
-                id=str(note["id"]),
-                author_username=note["author"]["username"],
-                body=body,
-                created_at=note["created_at"],
-                updated_at=note.get("updated_at"),
-                is_drift_comment="drift" in body.lower() or "🌊" in body,
-                file_path=file_path,
-                line_from=line_from,
-                line_to=line_to,
+            for change, diff_text in zip(changes, diffs, strict=True)
+        ]
+    except (KeyError, TypeError) as e:
+        raise ValueError(f"Invalid GitLab file change data: {e}") from e
+
+
+def to_comment(note: GitLabNote) -> Comment:
+    try:
+        missing = _missing_fields(NOTE_REQUIRED_KEYS, note)
+        if missing:
+            raise ValueError(
+                f"Invalid GitLab note data: missing required fields {missing}"
             )
-        except (KeyError, TypeError) as e:
-            raise ValueError(f"Invalid GitLab note data: {e}") from e
+
+        position = note.get("position")
+        file_path = None
+        line_from = None
+        line_to = None
+
+        if position:
+            file_path = position.get("new_path") or position.get("old_path")
+            if position.get("new_line"):
+                line_from = position.get("new_line")
+                line_to = position.get("new_line")
+            elif position.get("old_line"):
+                line_from = position.get("old_line")
+                line_to = position.get("old_line")
+
+        body = note.get("body") or ""
+        return Comment(
+            id=str(note["id"]),
+            author_username=note["author"]["username"],
+            body=body,
+            created_at=note["created_at"],
+            updated_at=note.get("updated_at"),
+            is_drift_comment=DRIFT_MARKER_PATTERN.search(body) is not None,
+            file_path=file_path,
+            line_from=line_from,
+            line_to=line_to,
+        )
+    except (KeyError, TypeError) as e:
+        raise ValueError(f"Invalid GitLab note data: {e}") from e
+
+
+class GitLabMapper:
+    to_pull_request_info = staticmethod(to_pull_request_info)
+    to_file_change = staticmethod(to_file_change)
+    to_file_changes = staticmethod(to_file_changes)
+    to_comment = staticmethod(to_comment)
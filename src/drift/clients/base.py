@@ -1,4 +1,5 @@
 from abc import ABC
+from collections.abc import Callable
 from typing import Any, Generic, TypeVar
 
 from drift.client import GitClient
@@ -18,16 +19,19 @@ class BaseGitClient(GitClient, RetryMixin, Generic[T], ABC):  # noqa: UP046
         cache_ttl: int = 300,
         max_retries: int = 3,
         backoff_factor: float = 1.0,
+        sleep_func: Callable[[float], None] | None = None,
     ) -> None:
-        super().__init__()
         self.client = client
         self.repo_identifier = repo_identifier
         self.logger = logger or get_logger(self.__class__.__name__)
         self.cache_ttl = cache_ttl
         self.max_retries = max_retries
         self.backoff_factor = backoff_factor
+        self.sleep_func = sleep_func
         self._repo: Any = None
         self._repo_load_failed: bool = False
+        # CacheMixin and RetryMixin read the settings above during initialisation
+        super().__init__()
 
     @property
     def repo(self) -> Any:
@@ -4,7 +4,6 @@ import secrets
 import sys
 from typing import Any
 
-from cachetools import TTLCache
 from github import Auth, Github
 from github.PullRequest import PullRequest
 
@@ -43,6 +42,7 @@ class GitHubClient(BaseGitClient[Github], CacheMixin, PaginationMixin):
             pool_size=10,
         )
         logger = logger or get_logger(self.__class__.__name__)
+        self.cache_max_size = cache_maxsize
         super().__init__(
             client=client,
             repo_identifier=repo_identifier,
@@ -51,8 +51,6 @@ class GitHubClient(BaseGitClient[Github], CacheMixin, PaginationMixin):
             max_retries=max_retries,
             backoff_factor=backoff_factor,
         )
-        self._cache: TTLCache[str, Any] = TTLCache(maxsize=cache_maxsize, ttl=cache_ttl)
-        self._cache_ttl = cache_ttl
         self._cache_salt = secrets.token_hex(16)
         self.per_page = min(per_page, 100)
         self.mapper = GitHubMapper()
@@ -6,7 +6,6 @@ import sys
 import time
 from typing import Any
 
-from cachetools import TTLCache
 from gitlab import Gitlab
 from gitlab.exceptions import GitlabError
 
@@ -61,6 +60,7 @@ class GitLabClient(BaseGitClient[Gitlab], CacheMixin, PaginationMixin):
             timeout=30,
         )
         logger = logger or get_logger(self.__class__.__name__)
+        self.cache_max_size = cache_maxsize
         super().__init__(
             client=client,
             repo_identifier=repo_identifier,
@@ -69,9 +69,6 @@ class GitLabClient(BaseGitClient[Gitlab], CacheMixin, PaginationMixin):
             max_retries=max_retries,
             backoff_factor=backoff_factor,
         )
-        self._cache: TTLCache[str, Any] = TTLCache(maxsize=cache_maxsize, ttl=cache_ttl)
-        self._cache_ttl = cache_ttl
-
         self._cache_salt = hashlib.sha256(
             f"{repo_identifier}:{secrets.token_hex(16)}:{time.time()}".encode()
         ).hexdigest()[:32]
@@ -288,19 +285,16 @@ class GitLabClient(BaseGitClient[Gitlab], CacheMixin, PaginationMixin):
 
             changes = self.with_retry(lambda: mr.changes())()
 
-            files = []
-            total_additions = 0
-            total_deletions = 0
-
-            for i, change in enumerate(changes.get("changes", [])):
-                if i >= self.MAX_FILES_PER_MR:
-                    self.logger.warning(
-                        f"MR {mr_id} has more than {self.MAX_FILES_PER_MR} files. "
-                        "Truncating."
-                    )
-                    break
+            raw_changes = changes.get("changes", [])
+            if len(raw_changes) > self.MAX_FILES_PER_MR:
+                self.logger.warning(
+                    f"MR {mr_id} has more than {self.MAX_FILES_PER_MR} files. "
+                    "Truncating."
+                )
+                raw_changes = raw_changes[: self.MAX_FILES_PER_MR]
 
-                change_data: GitLabChange = {
+            change_data: list[GitLabChange] = [
+                {
                     "old_path": change.get("old_path", ""),
                     "new_path": change.get("new_path", ""),
                     "new_file": change.get("new_file", False),
@@ -308,11 +302,12 @@ class GitLabClient(BaseGitClient[Gitlab], CacheMixin, PaginationMixin):
                     "renamed_file": change.get("renamed_file", False),
                     "diff": change.get("diff", ""),
                 }
+                for change in raw_changes
+            ]
 
-                file_change = self.mapper.to_file_change(change_data)
-                files.append(file_change)
-                total_additions += file_change.additions
-                total_deletions += file_change.deletions
+            files = self.mapper.to_file_changes(change_data)
+            total_additions = sum(file_change.additions for file_change in files)
+            total_deletions = sum(file_change.deletions for file_change in files)
 
             result = DiffData(
                 files=files,
@@ -496,6 +491,7 @@ class GitLabClient(BaseGitClient[Gitlab], CacheMixin, PaginationMixin):
                     break
 
             comments = []
+            to_comment = self.mapper.to_comment
             for i, note in enumerate(notes):
                 if i >= self.MAX_COMMENTS_PER_MR:
                     self.logger.warning(
@@ -515,7 +511,7 @@ class GitLabClient(BaseGitClient[Gitlab], CacheMixin, PaginationMixin):
                         ),
                         "position": None,
                     }
-                    comment = self.mapper.to_comment(note_data)
+                    comment = to_comment(note_data)
                     comments.append(comment)
                 except (AttributeError, KeyError, TypeError) as e:
                     self.logger.warning(f"Failed to process note in MR {mr_id}: {e}")
@@ -618,7 +614,7 @@ class GitLabClient(BaseGitClient[Gitlab], CacheMixin, PaginationMixin):
                             "position": position,
                         }
 
-                        comment = self.mapper.to_comment(discussion_note_data)
+                        comment = to_comment(discussion_note_data)
                         comments.append(comment)
                     except (AttributeError, KeyError, TypeError) as e:
                         self.logger.warning(
@@ -1,7 +1,6 @@
 from collections.abc import Callable
 from functools import wraps
-import hashlib
-import json
+from hashlib import blake2b
 from typing import Any
 
 from cachetools import TTLCache
@@ -19,24 +18,22 @@ class CacheMixin:
         self._cache_ttl = cache_ttl
 
     def _make_cache_key(self, *args: Any, **kwargs: Any) -> str:
-        key_data = {
-            "args": [str(arg) for arg in args],
-            "kwargs": {k: str(v) for k, v in sorted(kwargs.items())},
-        }
-        key_str = json.dumps(key_data, sort_keys=True)
-        return hashlib.sha256(key_str.encode()).hexdigest()
+        key_data = (
+            tuple(str(arg) for arg in args),
+            tuple((k, str(v)) for k, v in sorted(kwargs.items())),
+        )
+        return blake2b(repr(key_data).encode(), digest_size=16).hexdigest()
 
     def with_cache(
         self, ttl: int | None = None, key_prefix: str = ""
     ) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
         def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+            cache_ttl = ttl if ttl is not None else self._cache_ttl
+            if cache_ttl <= 0:
+                return func
+
             @wraps(func)
             def wrapper(*args: Any, **kwargs: Any) -> Any:
-                cache_ttl = ttl if ttl is not None else self._cache_ttl
-
-                if cache_ttl <= 0:
-                    return func(*args, **kwargs)
-
                 func_args = args[1:] if args and args[0] == self else args
                 cache_key = (
                     f"{key_prefix}{func.__name__}:"
@@ -61,13 +58,14 @@ class CacheMixin:
         if pattern is None:
             self._cache_logger.info("Clearing entire cache")
             self._cache.clear()
-        else:
-            keys_to_delete = [k for k in self._cache if pattern in k]
-            self._cache_logger.info(
-                f"Clearing {len(keys_to_delete)} cache entries matching '{pattern}'"
-            )
-            for key in keys_to_delete:
-                del self._cache[key]
+            return
+
+        keys_to_delete = [k for k in self._cache if k.startswith(pattern)]
+        self._cache_logger.info(
+            f"Clearing {len(keys_to_delete)} cache entries starting with '{pattern}'"
+        )
+        for key in keys_to_delete:
+            del self._cache[key]
 
     def get_cache_stats(self) -> dict[str, Any]:
         return {
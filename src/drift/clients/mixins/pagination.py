@@ -1,4 +1,6 @@
-from collections.abc import Callable, Generator
+from collections.abc import Callable, Generator, Iterable
+from itertools import islice
+import logging
 from typing import Any, TypeVar
 
 from drift.logger import get_logger
@@ -20,30 +22,31 @@ class PaginationMixin:
         page_size: int = 100,
         max_pages: int | None = None,
     ) -> Generator[T, None, None]:
+        logger = self._pagination_logger
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
         page = 1
         total_items = 0
 
         while max_pages is None or page <= max_pages:
-            self._pagination_logger.debug(f"Fetching page {page} (size={page_size})")
+            if debug_enabled:
+                logger.debug(f"Fetching page {page} (size={page_size})")
 
             try:
                 items, has_more = fetch_func(page)
             except Exception as e:
-                self._pagination_logger.error(f"Error fetching page {page}: {e}")
+                logger.error(f"Error fetching page {page}: {e}")
                 raise
 
-            for item in items:
-                yield item
-                total_items += 1
+            yield from items
+            total_items += len(items)
 
-            self._pagination_logger.debug(
-                f"Page {page} returned {len(items)} items (total: {total_items})"
-            )
+            if debug_enabled:
+                logger.debug(
+                    f"Page {page} returned {len(items)} items (total: {total_items})"
+                )
 
             if not has_more:
-                self._pagination_logger.info(
-                    f"Pagination complete. Total items: {total_items}"
-                )
+                logger.info(f"Pagination complete. Total items: {total_items}")
                 break
 
             page += 1
@@ -61,34 +64,44 @@ class PaginationMixin:
                 "For larger datasets, specify explicit limit."
             )
 
-        results: list[T] = []
+        results = list(islice(self.paginate(fetch_func, page_size), max_items))
+        if len(results) >= max_items:
+            self._pagination_logger.info(f"Reached max_items limit ({max_items})")
 
-        for item in self.paginate(fetch_func, page_size):
-            results.append(item)
-            if len(results) >= max_items:
+        return results
+
+    def _limit_items(
+        self, items: Iterable[Any], max_items: int | None
+    ) -> Generator[Any, None, None]:
+        # Validated here rather than in the generator so a bad limit fails at
+        # the call site instead of on first iteration
+        if max_items is not None and max_items < 0:
+            raise ValueError(f"max_items must be non-negative, got {max_items}")
+
+        def limited() -> Generator[Any, None, None]:
+            if max_items is None:
+                yield from items
+                return
+
+            count = 0
+            for item in islice(items, max_items):
+                yield item
+                count += 1
+            if count >= max_items:
                 self._pagination_logger.info(f"Reached max_items limit ({max_items})")
-                break
 
-        return results
+        return limited()
 
     def paginate_github(
-        self, paginated_list: Any, max_items: int | None = None
+        self, paginated_list: Iterable[Any], max_items: int | None = None
     ) -> Generator[Any, None, None]:
-        count = 0
-        for item in paginated_list:
-            yield item
-            count += 1
-            if max_items is not None and count >= max_items:
-                self._pagination_logger.info(f"Reached max_items limit ({max_items})")
-                break
+        """Yield at most max_items items; 0 yields nothing and a negative limit
+        raises ValueError."""
+        return self._limit_items(paginated_list, max_items)
 
     def paginate_gitlab(
-        self, generator: Generator[Any, None, None], max_items: int | None = None
+        self, generator: Iterable[Any], max_items: int | None = None
     ) -> Generator[Any, None, None]:
-        count = 0
-        for item in generator:
-            yield item
-            count += 1
-            if max_items is not None and count >= max_items:
-                self._pagination_logger.info(f"Reached max_items limit ({max_items})")
-                break
+        """Yield at most max_items items; 0 yields nothing and a negative limit
+        raises ValueError."""
+        return self._limit_items(generator, max_items)
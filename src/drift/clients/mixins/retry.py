@@ -1,21 +1,24 @@
 from collections.abc import Callable
+import random
 from typing import Any
 
-from tenacity import (
-    RetryCallState,
-    retry,
-    stop_after_attempt,
-    wait_exponential_jitter,
-)
+from tenacity import RetryCallState, nap, retry, stop_after_attempt
 
 from drift.exceptions import NetworkError, RateLimitError, TimeoutError
 from drift.logger import get_logger
 
 
+# Jitter only spreads retries out, so it does not need a CSPRNG
+_rand = random.random
+
+
 class RetryMixin:
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         super().__init__(*args, **kwargs)
         self._retry_logger = get_logger(f"{self.__class__.__name__}.RetryMixin")
+        self._retry_sleep: Callable[[float], None] = (
+            getattr(self, "sleep_func", None) or nap.sleep
+        )
 
     def with_retry(
         self,
@@ -42,6 +45,12 @@ class RetryMixin:
                 f"max_retries capped at {MAX_ALLOWED_RETRIES} (was {max_retries})"
             )
 
+        # Exponential backoff schedule, computed once per wrapped function
+        backoff_schedule = [
+            min(backoff_factor * (1 << attempt), max_wait)
+            for attempt in range(max(effective_max_retries, 1))
+        ]
+
         def wait_strategy(retry_state: RetryCallState) -> float:
             if retry_state.outcome and retry_state.outcome.failed:
                 exception = retry_state.outcome.exception()
@@ -53,19 +62,14 @@ class RetryMixin:
                     )
                     return wait_time
 
-            retry_count = retry_state.attempt_number - 1
+            retry_count = min(
+                max(retry_state.attempt_number - 1, 0), len(backoff_schedule) - 1
+            )
+            wait_time = backoff_schedule[retry_count]
 
             if jitter:
-                wait_func = wait_exponential_jitter(
-                    initial=backoff_factor,
-                    max=max_wait,
-                    jitter=max_wait,
-                )
-                return wait_func(retry_state)
-            else:
-                exponent = max(retry_count, 0)
-                wait_time = min(backoff_factor * (2**exponent), max_wait)
-                return float(wait_time)
+                return min(wait_time + _rand() * max_wait, max_wait)
+            return float(wait_time)
 
         def should_retry(retry_state: RetryCallState) -> bool:
             if not retry_state.outcome or not retry_state.outcome.failed:
@@ -93,6 +97,7 @@ class RetryMixin:
             wait=wait_strategy,
             retry=should_retry,
             reraise=True,
+            sleep=self._retry_sleep,
         )
 
         return retry_decorator(func)
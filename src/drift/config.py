@@ -9,6 +9,16 @@ from drift.client import GitProvider
 from drift.exceptions import ConfigurationError
 
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader  # type: ignore[assignment]
+
+ENV_VAR_REFERENCE_PATTERN = re.compile(
+    r"\$\{[^}]+\}|\$[A-Za-z_][A-Za-z0-9_]*(?![A-Za-z0-9_])"
+)
+
+
 @dataclass(frozen=True)
 class DriftConfig:
     provider: GitProvider
@@ -63,7 +73,8 @@ class DriftConfig:
 
     @classmethod
     def from_env(cls) -> "DriftConfig":
-        provider_str = os.environ.get("DRIFT_PROVIDER", "").lower()
+        env = os.environ
+        provider_str = env.get("DRIFT_PROVIDER", "").lower()
         if not provider_str:
             raise ConfigurationError("DRIFT_PROVIDER environment variable not set")
 
@@ -73,19 +84,19 @@ class DriftConfig:
             raise ConfigurationError(f"Invalid provider: {provider_str}") from e
 
         token_env = f"{provider.value.upper()}_TOKEN"
-        token = os.environ.get(token_env)
+        token = env.get(token_env)
         if not token:
             raise ConfigurationError(f"{token_env} environment variable not set")
 
-        repo = os.environ.get("DRIFT_REPO")
+        repo = env.get("DRIFT_REPO")
         if not repo:
             raise ConfigurationError("DRIFT_REPO environment variable not set")
 
         base_url = None
         if provider == GitProvider.GITHUB:
-            base_url = os.environ.get("GITHUB_BASE_URL")
+            base_url = env.get("GITHUB_BASE_URL")
         elif provider == GitProvider.GITLAB:
-            base_url = os.environ.get("GITLAB_URL")
+            base_url = env.get("GITLAB_URL")
 
         return cls(
             provider=provider,
@@ -93,21 +104,21 @@ class DriftConfig:
             repo=repo,
             base_url=base_url,
             cache_ttl=cls._safe_parse_int(
-                os.environ.get("DRIFT_CACHE_TTL", ""), "DRIFT_CACHE_TTL", 300
+                env.get("DRIFT_CACHE_TTL", ""), "DRIFT_CACHE_TTL", 300
             ),
             max_retries=cls._safe_parse_int(
-                os.environ.get("DRIFT_MAX_RETRIES", ""), "DRIFT_MAX_RETRIES", 3
+                env.get("DRIFT_MAX_RETRIES", ""), "DRIFT_MAX_RETRIES", 3
             ),
             backoff_factor=cls._safe_parse_float(
-                os.environ.get("DRIFT_BACKOFF_FACTOR", ""), "DRIFT_BACKOFF_FACTOR", 1.0
+                env.get("DRIFT_BACKOFF_FACTOR", ""), "DRIFT_BACKOFF_FACTOR", 1.0
             ),
             timeout=cls._safe_parse_int(
-                os.environ.get("DRIFT_TIMEOUT", ""), "DRIFT_TIMEOUT", 30
+                env.get("DRIFT_TIMEOUT", ""), "DRIFT_TIMEOUT", 30
             ),
-            log_level=os.environ.get("DRIFT_LOG_LEVEL", "INFO"),
-            log_format=os.environ.get("DRIFT_LOG_FORMAT", "json"),
+            log_level=env.get("DRIFT_LOG_LEVEL", "INFO"),
+            log_format=env.get("DRIFT_LOG_FORMAT", "json"),
             connection_pool_size=cls._safe_parse_int(
-                os.environ.get("DRIFT_CONNECTION_POOL_SIZE", ""),
+                env.get("DRIFT_CONNECTION_POOL_SIZE", ""),
                 "DRIFT_CONNECTION_POOL_SIZE",
                 10,
             ),
@@ -121,7 +132,7 @@ class DriftConfig:
 
         try:
             with open(path) as f:
-                data = yaml.safe_load(f)
+                data = yaml.load(f, Loader=SafeLoader)
         except yaml.YAMLError as e:
             raise ConfigurationError(f"Invalid YAML in configuration file: {e}") from e
 
@@ -142,11 +153,9 @@ class DriftConfig:
         if not token:
             raise ConfigurationError("authentication.token not specified")
 
-        if re.search(r"\$\{[^}]+\}|\$[A-Za-z_][A-Za-z0-9_]*(?![A-Za-z0-9_])", token):
+        if ENV_VAR_REFERENCE_PATTERN.search(token):
             expanded_token = os.path.expandvars(token)
-            if re.search(
-                r"\$\{[^}]+\}|\$[A-Za-z_][A-Za-z0-9_]*(?![A-Za-z0-9_])", expanded_token
-            ):
+            if ENV_VAR_REFERENCE_PATTERN.search(expanded_token):
                 # Don't reveal the token value in error message
                 raise ConfigurationError(
                     "Token configuration error: Environment variable not found"
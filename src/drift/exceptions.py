@@ -1,3 +1,6 @@
+from typing import Any
+
+
 class DriftException(Exception):
     pass
 
@@ -11,6 +14,11 @@ class RateLimitError(DriftException):
         super().__init__(*args)
         self.reset_time = reset_time
 
+    def __reduce__(self) -> tuple[Any, ...]:
+        # The default reduce rebuilds from args alone, which would shift the
+        # message into reset_time
+        return type(self), (self.reset_time, *self.args), self.__dict__
+
 
 class ResourceNotFoundError(DriftException):
     pass
@@ -24,6 +32,9 @@ class APIError(DriftException):
         self.status_code = status_code
         self.message = message
 
+    def __reduce__(self) -> tuple[Any, ...]:
+        return type(self), (self.status_code, *self.args), self.__dict__
+
 
 class ConfigurationError(DriftException):
     pass
@@ -1,12 +1,35 @@
+from functools import lru_cache
 import logging
 import sys
+import time
+
+
+_configured = False
+
+
+class _DriftFormatter(logging.Formatter):
+    """Formatter that reuses the rendered timestamp for records in the same second."""
+
+    _time_cache: tuple[int, str, str] = (-1, "", "")
+
+    def formatTime(self, record: logging.LogRecord, datefmt: str | None = None) -> str:
+        datefmt = datefmt or self.datefmt
+        if not datefmt:
+            return super().formatTime(record, datefmt)
+
+        second = int(record.created)
+        if (second, datefmt) != self._time_cache[:2]:
+            rendered = time.strftime(datefmt, self.converter(second))
+            self._time_cache = (second, datefmt, rendered)
+        return self._time_cache[2]
 
 
 def setup_logging(level: str = "INFO") -> None:
+    global _configured
     logger = logging.getLogger("drift")
 
-    if not logger.handlers:
-        formatter = logging.Formatter(
+    if not _configured:
+        formatter = _DriftFormatter(
             fmt="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
             datefmt="%Y-%m-%d %H:%M:%S",
         )
@@ -14,9 +37,11 @@ def setup_logging(level: str = "INFO") -> None:
         handler = logging.StreamHandler(sys.stdout)
         handler.setFormatter(formatter)
         logger.addHandler(handler)
+        _configured = True
 
     logger.setLevel(level)
 
 
+@lru_cache(maxsize=128)
 def get_logger(name: str) -> logging.Logger:
     return logging.getLogger(f"drift.{name}")
@@ -8,10 +8,13 @@ def reset_logging():
     """Reset logging configuration before each test."""
     # Get the drift logger
     logger = logging.getLogger("drift")
+    root = logging.getLogger()
 
     # Store original state
     original_handlers = logger.handlers[:]
     original_propagate = logger.propagate
+    original_root_handlers = root.handlers[:]
+    original_root_level = root.level
 
     # Clear handlers and ensure propagation for tests
     logger.handlers.clear()
@@ -22,3 +25,5 @@ def reset_logging():
     # Restore original state
     logger.handlers = original_handlers
     logger.propagate = original_propagate
+    root.handlers[:] = original_root_handlers
+    root.setLevel(original_root_level)
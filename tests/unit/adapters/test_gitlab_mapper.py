@@ -133,6 +133,92 @@ def test_should_map_file_change_when_file_is_modified():
     assert "@@ -10,3 +10,4 @@" in result.patch
 
 
+@pytest.mark.parametrize(
+    ("new_file", "deleted_file", "renamed_file", "expected"),
+    [
+        (True, True, True, FileStatus.ADDED),
+        (None, True, True, FileStatus.DELETED),
+        (None, None, True, FileStatus.RENAMED),
+        (None, None, None, FileStatus.MODIFIED),
+    ],
+)
+def test_should_prioritize_status_flags_when_mapping_file_change(
+    new_file, deleted_file, renamed_file, expected
+):
+    change_data = {
+        "old_path": "src/file.py",
+        "new_path": "src/file.py",
+        "new_file": new_file,
+        "deleted_file": deleted_file,
+        "renamed_file": renamed_file,
+        "diff": None,
+    }
+
+    result = GitLabMapper.to_file_change(change_data)
+
+    assert result.status == expected
+
+
+def test_should_not_count_file_headers_when_mapping_file_change():
+    change_data = {
+        "old_path": "src/file.py",
+        "new_path": "src/file.py",
+        "new_file": False,
+        "deleted_file": False,
+        "renamed_file": False,
+        "diff": (
+            "--- a/src/file.py\n+++ b/src/file.py\n@@ -1,2 +1,2 @@\n"
+            "-old line\n+new line\n+another line\n context"
+        ),
+    }
+
+    result = GitLabMapper.to_file_change(change_data)
+
+    assert result.additions == 2
+    assert result.deletions == 1
+
+
+def test_should_map_file_changes_in_batch():
+    changes = [
+        {
+            "old_path": "a.py",
+            "new_path": "a.py",
+            "new_file": True,
+            "deleted_file": False,
+            "renamed_file": False,
+            "diff": "+one\n+two",
+        },
+        {
+            "old_path": "old.py",
+            "new_path": "new.py",
+            "new_file": False,
+            "deleted_file": False,
+            "renamed_file": True,
+            "diff": "-gone",
+        },
+    ]
+
+    results = GitLabMapper.to_file_changes(changes)
+
+    assert [r.path for r in results] == ["a.py", "new.py"]
+    assert [r.status for r in results] == [FileStatus.ADDED, FileStatus.RENAMED]
+    assert [r.additions for r in results] == [2, 0]
+    assert [r.deletions for r in results] == [0, 1]
+    assert results[1].old_path == "old.py"
+
+
+def test_should_raise_error_when_any_batched_file_change_is_invalid():
+    changes = [
+        {"old_path": "a.py", "new_path": "a.py", "diff": "+x"},
+        {"old_path": "b.py"},
+    ]
+
+    with pytest.raises(
+        ValueError, match=r"file change data: missing required fields \['new_path'\]"
+    ):
+        GitLabMapper.to_file_changes(changes)
+
+
 def test_should_map_comment_when_note_contains_drift_marker():
     note_data = {
         "id": 12345,
@@ -156,6 +242,21 @@ def test_should_map_comment_when_note_contains_drift_marker():
     assert result.line_to is None
 
 
+def test_should_detect_drift_keyword_regardless_of_case():
+    note_data = {
+        "id": 12346,
+        "author": {"username": "drift-bot"},
+        "body": "## DRIFT Review\nNo issues found.",
+        "created_at": "2023-01-01T12:00:00Z",
+        "updated_at": None,
+        "position": None,
+    }
+
+    result = GitLabMapper.to_comment(note_data)
+
+    assert result.is_drift_comment is True
+
+
 def test_should_map_comment_when_note_has_new_line_position():
     note_data = {
         "id": 54321,
@@ -224,7 +325,10 @@ def test_should_raise_error_when_mr_data_is_missing_fields():
         "title": "Test MR",
     }
 
-    with pytest.raises(ValueError, match="Invalid GitLab merge request data"):
+    with pytest.raises(
+        ValueError,
+        match=r"merge request data: missing required fields \['author', 'created_at'",
+    ):
         GitLabMapper.to_pull_request_info(mr_data)
 
 
@@ -240,7 +344,9 @@ def test_should_raise_error_when_mr_author_is_missing_username():
         "updated_at": "2023-01-02T12:00:00Z",
     }
 
-    with pytest.raises(ValueError, match="Invalid GitLab merge request data"):
+    with pytest.raises(
+        ValueError, match=r"missing required fields \['author\.username'\]"
+    ):
         GitLabMapper.to_pull_request_info(mr_data)
 
 
@@ -249,7 +355,9 @@ def test_should_raise_error_when_file_change_data_is_invalid():
         "old_path": "file.py",
     }
 
-    with pytest.raises(ValueError, match="Invalid GitLab file change data"):
+    with pytest.raises(
+        ValueError, match=r"file change data: missing required fields \['new_path'\]"
+    ):
         GitLabMapper.to_file_change(change_data)
 
 
@@ -259,7 +367,10 @@ def test_should_raise_error_when_note_data_is_missing_fields():
         "body": "Comment",
     }
 
-    with pytest.raises(ValueError, match="Invalid GitLab note data"):
+    with pytest.raises(
+        ValueError,
+        match=r"note data: missing required fields \['author', 'created_at'\]",
+    ):
         GitLabMapper.to_comment(note_data)
 
 
@@ -271,7 +382,9 @@ def test_should_raise_error_when_note_author_is_missing_username():
         "created_at": "2023-01-01T12:00:00Z",
     }
 
-    with pytest.raises(ValueError, match="Invalid GitLab note data"):
+    with pytest.raises(
+        ValueError, match=r"note data: missing required fields \['author\.username'\]"
+    ):
         GitLabMapper.to_comment(note_data)
 
 
@@ -78,6 +78,15 @@ def test_should_not_cache_when_ttl_is_zero() -> None:
     assert mock_func.call_count == 2
 
 
+def test_should_return_undecorated_function_when_ttl_is_zero() -> None:
+    instance = CacheTestHelper(cache_ttl=300)
+
+    def func() -> str:
+        return "result"
+
+    assert instance.with_cache(ttl=0)(func) is func
+
+
 def test_should_clear_all_entries_when_clear_cache_called() -> None:
     instance = CacheTestHelper()
 
@@ -96,9 +105,42 @@ def test_should_clear_matching_entries_when_pattern_is_provided() -> None:
     instance._cache["test_key1"] = "value1"
     instance._cache["test_key2"] = "value2"
     instance._cache["other_key"] = "value3"
+    instance._cache["other_test_key"] = "value4"
 
     instance.clear_cache("test")
 
     assert "test_key1" not in instance._cache
     assert "test_key2" not in instance._cache
     assert "other_key" in instance._cache
+    assert "other_test_key" in instance._cache
+
+
+def test_should_clear_overlapping_namespaces_when_pattern_is_a_prefix() -> None:
+    instance = CacheTestHelper()
+
+    @instance.with_cache()
+    def get(item_id: str) -> str:
+        return f"item-{item_id}"
+
+    @instance.with_cache()
+    def get_pr(pr_id: str) -> str:
+        return f"pr-{pr_id}"
+
+    get("1")
+    get_pr("1")
+    instance._cache["get_direct"] = "value"
+
+    instance.clear_cache("get")
+
+    assert len(instance._cache) == 0
+
+
+def test_should_build_fixed_size_cache_keys_independent_of_kwarg_order() -> None:
+    instance = CacheTestHelper()
+
+    key1 = instance._make_cache_key("arg1", "x" * 10_000, a=1, b=2)
+    key2 = instance._make_cache_key("arg1", "x" * 10_000, b=2, a=1)
+
+    assert key1 == key2
+    assert len(key1) == 32
+    assert key1 != instance._make_cache_key("arg1", a=1, b=2)
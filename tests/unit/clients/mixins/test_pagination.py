@@ -1,3 +1,5 @@
+import logging
+
 import pytest
 
 from drift.clients.mixins.pagination import PaginationMixin
@@ -98,14 +100,16 @@ def test_should_paginate_github_list_when_paginate_github_called() -> None:
     assert results == mock_paginated_list
 
 
-def test_should_limit_github_items_when_max_items_is_set() -> None:
+def test_should_limit_github_items_when_max_items_is_set(caplog) -> None:
     instance = PaginationTestHelper()
 
     mock_paginated_list = ["item1", "item2", "item3", "item4", "item5"]
 
-    results = list(instance.paginate_github(mock_paginated_list, max_items=3))
+    with caplog.at_level(logging.INFO):
+        results = list(instance.paginate_github(mock_paginated_list, max_items=3))
 
     assert results == ["item1", "item2", "item3"]
+    assert "Reached max_items limit (3)" in caplog.text
 
 
 def test_should_paginate_gitlab_generator_when_paginate_gitlab_called() -> None:
@@ -121,14 +125,47 @@ def test_should_paginate_gitlab_generator_when_paginate_gitlab_called() -> None:
     assert results == ["item1", "item2", "item3"]
 
 
-def test_should_limit_gitlab_items_when_max_items_is_set() -> None:
+def test_should_limit_gitlab_items_when_max_items_is_set(caplog) -> None:
     instance = PaginationTestHelper()
 
     def mock_generator():
         for i in range(1, 11):
             yield f"item{i}"
 
-    results = list(instance.paginate_gitlab(mock_generator(), max_items=5))
+    with caplog.at_level(logging.INFO):
+        results = list(instance.paginate_gitlab(mock_generator(), max_items=5))
 
     assert len(results) == 5
     assert results == ["item1", "item2", "item3", "item4", "item5"]
+    assert "Reached max_items limit (5)" in caplog.text
+
+
+def test_should_not_log_limit_when_items_run_out_first(caplog) -> None:
+    instance = PaginationTestHelper()
+
+    with caplog.at_level(logging.INFO):
+        results = list(instance.paginate_github(["item1", "item2"], max_items=3))
+
+    assert results == ["item1", "item2"]
+    assert "Reached max_items limit" not in caplog.text
+
+
+def test_should_yield_nothing_when_max_items_is_zero(caplog) -> None:
+    instance = PaginationTestHelper()
+
+    with caplog.at_level(logging.INFO):
+        github_results = list(instance.paginate_github(["item1"], max_items=0))
+        gitlab_results = list(instance.paginate_gitlab(iter(["item1"]), max_items=0))
+
+    assert github_results == []
+    assert gitlab_results == []
+    assert "Reached max_items limit (0)" in caplog.text
+
+
+def test_should_raise_error_when_max_items_is_negative() -> None:
+    instance = PaginationTestHelper()
+
+    with pytest.raises(ValueError, match="max_items must be non-negative, got -1"):
+        instance.paginate_github(["item1"], max_items=-1)
+    with pytest.raises(ValueError, match="max_items must be non-negative, got -1"):
+        instance.paginate_gitlab(iter(["item1"]), max_items=-1)
@@ -80,6 +80,29 @@ def test_should_use_exponential_backoff_when_jitter_is_disabled() -> None:
     assert sleep_times[1] == 2.0  # Second retry: backoff_factor * 2^1
 
 
+def test_should_keep_jittered_wait_within_bounds() -> None:
+    instance = RetryTestHelper()
+    mock_func = Mock(side_effect=[NetworkError("fail")] * 3 + ["success"])
+
+    wrapped = instance.with_retry(
+        mock_func, max_retries=4, backoff_factor=0.5, max_wait=3.0
+    )
+
+    sleep_times = []
+
+    def mock_sleep(seconds: float) -> None:
+        sleep_times.append(seconds)
+
+    with (
+        patch("time.sleep", side_effect=mock_sleep),
+        patch("drift.clients.mixins.retry._rand", return_value=0.25),
+    ):
+        result = wrapped()
+
+    assert result == "success"
+    assert sleep_times == [1.25, 1.75, 2.75]
+
+
 def test_should_respect_max_wait_when_backoff_exceeds_limit() -> None:
     instance = RetryTestHelper()
     mock_func = Mock(side_effect=[NetworkError("fail")] * 5 + ["success"])
@@ -1,4 +1,4 @@
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
 
 from drift.clients.base import BaseGitClient
 
@@ -63,11 +63,13 @@ def test_should_lazy_load_repository_when_accessed() -> None:
 def test_should_retry_and_succeed_when_function_fails_then_works() -> None:
     from drift.exceptions import NetworkError
 
+    mock_sleep = Mock()
     client = ConcreteGitClient(
         client=Mock(),
         repo_identifier="owner/repo",
         max_retries=3,
         backoff_factor=0.01,
+        sleep_func=mock_sleep,
     )
 
     mock_func = Mock(
@@ -75,8 +77,7 @@ def test_should_retry_and_succeed_when_function_fails_then_works() -> None:
     )
     wrapped = client.with_retry(mock_func)
 
-    with patch("time.sleep") as mock_sleep:
-        result = wrapped()
+    result = wrapped()
 
     assert result == "success"
     assert mock_func.call_count == 3
@@ -1,4 +1,5 @@
 from datetime import datetime
+from types import SimpleNamespace
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
@@ -8,36 +9,53 @@ from drift.exceptions import AuthenticationError, ResourceNotFoundError
 from drift.models import Comment, DiffData, FileStatus, PullRequestInfo
 
 
-@pytest.fixture
+FROZEN_NOW = datetime(2024, 1, 1, 12, 0, 0)
+ADDED_FILE_ATTRS = {
+    "status": "added",
+    "additions": 1,
+    "deletions": 0,
+    "patch": "+",
+    "previous_filename": None,
+}
+
+
+@pytest.fixture(scope="module")
 def mock_github():
     with patch("drift.clients.github_client.Github") as mock:
         yield mock
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_auth():
     with patch("drift.clients.github_client.Auth") as mock:
         yield mock
 
 
+@pytest.fixture(autouse=True)
+def _reset_github_mocks(mock_github, mock_auth):
+    yield
+    mock_github.reset_mock(return_value=True, side_effect=True)
+    mock_auth.reset_mock(return_value=True, side_effect=True)
+
+
 @pytest.fixture
 def github_client(mock_github, mock_auth):
     mock_auth.Token.return_value = Mock()
-    return GitHubClient(token="fake_token", repo_identifier="owner/repo")
+    client = GitHubClient(token="fake_token", repo_identifier="owner/repo")
+    client._repo = Mock(spec=["get_pull"])
+    return client
 
 
-@pytest.fixture
-def mock_pr():
-    pr = MagicMock()
+def _configure_pr(pr):
     pr.number = 123
     pr.title = "Test PR"
     pr.body = "Test description"
-    pr.user.login = "testuser"
-    pr.head.ref = "feature-branch"
-    pr.base.ref = "main"
+    pr.user = SimpleNamespace(login="testuser")
+    pr.head = SimpleNamespace(ref="feature-branch")
+    pr.base = SimpleNamespace(ref="main")
     pr.state = "open"
     pr.merged = False
-    pr.created_at = datetime(2024, 1, 1, 12, 0, 0)
+    pr.created_at = FROZEN_NOW
     pr.updated_at = datetime(2024, 1, 2, 12, 0, 0)
     pr.additions = 100
     pr.deletions = 50
@@ -50,9 +68,25 @@ def mock_pr():
     pr.milestone = None
     pr.closed_at = None
     pr.merged_at = None
+    pr.get_files = Mock()
+    pr.get_commits = Mock()
+    pr.get_issue_comments = Mock()
+    pr.get_comments = Mock()
+    pr.create_issue_comment = Mock()
     return pr
 
 
+@pytest.fixture(scope="module")
+def mock_pr():
+    return _configure_pr(SimpleNamespace())
+
+
+@pytest.fixture(autouse=True)
+def _reset_pr(mock_pr):
+    yield
+    _configure_pr(mock_pr)
+
+
 def test_should_initialize_github_client_with_valid_config(mock_github, mock_auth):
     mock_auth.Token.return_value = Mock()
     client = GitHubClient(
@@ -67,10 +101,12 @@ def test_should_initialize_github_client_with_valid_config(mock_github, mock_aut
     assert client.cache_ttl == 600
     assert client.max_retries == 5
     assert client._cache.maxsize == 1000
+    assert client._cache.ttl == 600
     mock_github.assert_called_once()
 
 
 def test_should_handle_authentication_error_when_loading_repository(github_client):
+    github_client._repo = None
     github_client.client.get_repo.side_effect = Exception("401 Unauthorized")
 
     with pytest.raises(AuthenticationError):
@@ -78,7 +114,6 @@ def test_should_handle_authentication_error_when_loading_repository(github_clien
 
 
 def test_should_get_pr_info_successfully(github_client, mock_pr):
-    github_client._repo = Mock()
     github_client.repo.get_pull.return_value = mock_pr
 
     pr_info = github_client.get_pr_info("123")
@@ -90,7 +125,6 @@ def test_should_get_pr_info_successfully(github_client, mock_pr):
 
 
 def test_should_use_cache_on_repeated_calls(github_client, mock_pr):
-    github_client._repo = Mock()
     github_client.repo.get_pull.return_value = mock_pr
 
     pr_info1 = github_client.get_pr_info("123")
@@ -101,18 +135,18 @@ def test_should_use_cache_on_repeated_calls(github_client, mock_pr):
 
 
 def test_should_get_diff_data_with_files(github_client, mock_pr):
-    github_client._repo = Mock()
     github_client.repo.get_pull.return_value = mock_pr
 
-    mock_file = MagicMock()
-    mock_file.filename = "test.py"
-    mock_file.status = "modified"
-    mock_file.additions = 10
-    mock_file.deletions = 5
-    mock_file.patch = "@@ -1,3 +1,3 @@\n-old\n+new"
-    mock_file.previous_filename = None
+    mock_file = SimpleNamespace(
+        filename="test.py",
+        status="modified",
+        additions=10,
+        deletions=5,
+        patch="@@ -1,3 +1,3 @@\n-old\n+new",
+        previous_filename=None,
+    )
 
-    mock_pr.get_files.return_value.__iter__ = Mock(return_value=iter([mock_file]))
+    mock_pr.get_files.return_value = [mock_file]
 
     diff_data = github_client.get_diff_data("123")
 
@@ -124,12 +158,11 @@ def test_should_get_diff_data_with_files(github_client, mock_pr):
 
 
 def test_should_get_commit_messages(github_client, mock_pr):
-    github_client._repo = Mock()
     github_client.repo.get_pull.return_value = mock_pr
 
     mock_commit = MagicMock()
     mock_commit.commit.message = "Test commit"
-    mock_pr.get_commits.return_value.__iter__ = Mock(return_value=iter([mock_commit]))
+    mock_pr.get_commits.return_value = [mock_commit]
 
     messages = github_client.get_commit_messages("123")
 
@@ -137,7 +170,6 @@ def test_should_get_commit_messages(github_client, mock_pr):
 
 
 def test_should_get_pr_context_with_all_fields(github_client, mock_pr):
-    github_client._repo = Mock()
     github_client.repo.get_pull.return_value = mock_pr
 
     context = github_client.get_pr_context("123")
@@ -151,20 +183,17 @@ def test_should_get_pr_context_with_all_fields(github_client, mock_pr):
 
 
 def test_should_get_and_post_comments(github_client, mock_pr):
-    github_client._repo = Mock()
     github_client.repo.get_pull.return_value = mock_pr
 
     mock_comment = MagicMock()
     mock_comment.id = 1
     mock_comment.user.login = "user"
     mock_comment.body = "comment"
-    mock_comment.created_at = datetime.now()
+    mock_comment.created_at = FROZEN_NOW
     mock_comment.updated_at = None
 
-    mock_pr.get_issue_comments.return_value.__iter__ = Mock(
-        return_value=iter([mock_comment])
-    )
-    mock_pr.get_comments.return_value.__iter__ = Mock(return_value=iter([]))
+    mock_pr.get_issue_comments.return_value = [mock_comment]
+    mock_pr.get_comments.return_value = []
 
     comments = github_client.get_existing_comments("123")
     assert len(comments) == 1
@@ -175,7 +204,6 @@ def test_should_get_and_post_comments(github_client, mock_pr):
 
 
 def test_should_handle_resource_not_found_errors(github_client):
-    github_client._repo = Mock()
     github_client.repo.get_pull.side_effect = Exception("404")
 
     with pytest.raises(ResourceNotFoundError):
@@ -183,8 +211,6 @@ def test_should_handle_resource_not_found_errors(github_client):
 
 
 def test_should_validate_input_and_prevent_injection(github_client):
-    github_client._repo = Mock()
-
     with pytest.raises(ResourceNotFoundError):
         github_client.get_pr_info("invalid")
 
@@ -192,19 +218,12 @@ def test_should_validate_input_and_prevent_injection(github_client):
 
 
 def test_should_limit_resources_to_prevent_exhaustion(github_client, mock_pr):
-    github_client._repo = Mock()
     github_client.repo.get_pull.return_value = mock_pr
 
-    many_files = [MagicMock() for _ in range(1500)]
-    for i, f in enumerate(many_files):
-        f.filename = f"file{i}.py"
-        f.status = "added"
-        f.additions = 1
-        f.deletions = 0
-        f.patch = "+"
-        f.previous_filename = None
-
-    mock_pr.get_files.return_value.__iter__ = Mock(return_value=iter(many_files))
+    mock_pr.get_files.return_value = (
+        SimpleNamespace(filename=f"file{i}.py", **ADDED_FILE_ATTRS)
+        for i in range(github_client.MAX_FILES_PER_PR + 5)
+    )
 
     diff_data = github_client.get_diff_data("123")
 
@@ -1,4 +1,7 @@
-from unittest.mock import MagicMock, patch
+from collections import namedtuple
+import re
+from types import SimpleNamespace
+from unittest.mock import MagicMock, Mock, patch
 
 from gitlab.exceptions import GitlabError
 import pytest
@@ -13,50 +16,103 @@ from drift.exceptions import (
 from drift.models import Comment, DiffData, FileStatus, PullRequestInfo
 
 
-@pytest.fixture
+Commit = namedtuple("Commit", ["message"])
+
+ERR_INVALID_REPO_FORMAT = re.compile("Invalid repository identifier format")
+ERR_INVALID_PROJECT_ID = re.compile("Invalid project ID range")
+ERR_INVALID_CHARACTERS = re.compile("Invalid characters")
+ERR_REPO_TOO_LONG = re.compile("Repository identifier too long")
+ERR_EMPTY_COMMENT = re.compile("Comment cannot be empty")
+
+MR_ATTRS = {
+    "iid": 123,
+    "title": "Test MR",
+    "description": "Test description",
+    "author": {"username": "testuser"},
+    "source_branch": "feature-branch",
+    "target_branch": "main",
+    "state": "opened",
+    "created_at": "2024-01-01T12:00:00Z",
+    "updated_at": "2024-01-02T12:00:00Z",
+    "merge_status": "can_be_merged",
+    "has_conflicts": False,
+    "work_in_progress": False,
+    "draft": False,
+    "mergeable": True,
+    "pipeline": {"status": "success"},
+    "approvals_required": 2,
+    "approvals_left": 1,
+    "discussion_locked": False,
+    "assignee": None,
+    "milestone": None,
+    "labels": [],
+}
+
+
+# Serves a fixed list through python-gitlab's page/per_page list() contract
+def _paginate(items):
+    def list_page(**kwargs):
+        page = kwargs.get("page", 1)
+        per_page = kwargs.get("per_page", 100)
+        start = (page - 1) * per_page
+        return items[start : start + per_page]
+
+    return list_page
+
+
+@pytest.fixture(scope="module")
 def mock_gitlab():
     with patch("drift.clients.gitlab_client.Gitlab") as mock:
         yield mock
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def gitlab_client(mock_gitlab):
     client = GitLabClient(token="fake_token", repo_identifier="owner/repo")
     return client
 
 
+@pytest.fixture(autouse=True)
+def _reset_gitlab_client(gitlab_client, mock_gitlab):
+    mock_gitlab.reset_mock()
+    yield
+    gitlab_client.client.reset_mock(return_value=True, side_effect=True)
+    gitlab_client._repo = None
+    gitlab_client._repo_load_failed = False
+    gitlab_client.clear_cache()
+
+
 @pytest.fixture
 def mock_mr():
-    mr = MagicMock()
-    mr.iid = 123
-    mr.title = "Test MR"
-    mr.description = "Test description"
-    mr.author = {"username": "testuser"}
-    mr.source_branch = "feature-branch"
-    mr.target_branch = "main"
-    mr.state = "opened"
-    mr.created_at = "2024-01-01T12:00:00Z"
-    mr.updated_at = "2024-01-02T12:00:00Z"
-    mr.merge_status = "can_be_merged"
-    mr.has_conflicts = False
-    mr.work_in_progress = False
-    mr.draft = False
-    mr.mergeable = True
-    mr.pipeline = {"status": "success"}
-    mr.approvals_required = 2
-    mr.approvals_left = 1
-    mr.discussion_locked = False
-    mr.assignee = None
-    mr.milestone = None
-    mr.labels = []
-    return mr
+    return MagicMock(**MR_ATTRS)
+
+
+@pytest.fixture(scope="session")
+def oversized_changes():
+    return [
+        {
+            "old_path": f"file{i}.py",
+            "new_path": f"file{i}.py",
+            "new_file": False,
+            "deleted_file": False,
+            "renamed_file": False,
+            "diff": "some diff",
+        }
+        for i in range(GitLabClient.MAX_FILES_PER_MR + 100)
+    ]
+
+
+@pytest.fixture(scope="session")
+def oversized_commits():
+    return [Commit(f"commit {i}") for i in range(GitLabClient.MAX_COMMITS_PER_MR + 100)]
 
 
 @pytest.fixture
-def mock_project():
-    project = MagicMock()
-    project.mergerequests = MagicMock()
-    return project
+def gitlab_client_with_mr(gitlab_client, mock_mr):
+    project = SimpleNamespace(mergerequests=Mock())
+    project.mergerequests.get.return_value = mock_mr
+    gitlab_client._repo = project
+    return gitlab_client, mock_mr, project
 
 
 class TestGitLabClient:
@@ -79,31 +135,27 @@ class TestGitLabClient:
             timeout=30,
         )
 
-    def test_should_validate_repo_identifier_with_namespace_format(self):
-        GitLabClient._validate_repo_identifier("namespace/project")
-        GitLabClient._validate_repo_identifier("group/subgroup/project")
-
-        with pytest.raises(ValueError, match="Invalid repository identifier format"):
-            GitLabClient._validate_repo_identifier("invalid")
-
-    def test_should_validate_repo_identifier_with_numeric_id(self):
-        GitLabClient._validate_repo_identifier("12345")
-        GitLabClient._validate_repo_identifier("1")
-
-        with pytest.raises(ValueError, match="Invalid project ID range"):
-            GitLabClient._validate_repo_identifier("2147483648")
-
-    def test_should_validate_repo_identifier_with_invalid_characters(self):
-        with pytest.raises(ValueError, match="Invalid characters"):
-            GitLabClient._validate_repo_identifier("namespace/project@123")
-
-    def test_should_validate_repo_identifier_with_length_limits(self):
-        long_path = "a" * 256
-        with pytest.raises(ValueError, match="Repository identifier too long"):
-            GitLabClient._validate_repo_identifier(long_path)
+    @pytest.mark.parametrize(
+        "identifier", ["namespace/project", "group/subgroup/project", "12345", "1"]
+    )
+    def test_should_accept_valid_repo_identifier(self, identifier):
+        GitLabClient._validate_repo_identifier(identifier)
+
+    @pytest.mark.parametrize(
+        "identifier,expected_message",
+        [
+            ("invalid", ERR_INVALID_REPO_FORMAT),
+            ("2147483648", ERR_INVALID_PROJECT_ID),
+            ("namespace/project@123", ERR_INVALID_CHARACTERS),
+            ("a" * 256, ERR_REPO_TOO_LONG),
+        ],
+    )
+    def test_should_reject_invalid_repo_identifier(self, identifier, expected_message):
+        with pytest.raises(ValueError, match=expected_message):
+            GitLabClient._validate_repo_identifier(identifier)
 
     def test_should_load_repository_successfully(self, gitlab_client, mock_gitlab):
-        mock_project = MagicMock()
+        mock_project = object()
         gitlab_client.client.projects.get.return_value = mock_project
 
         result = gitlab_client._load_repository()
@@ -125,11 +177,8 @@ class TestGitLabClient:
         with pytest.raises(ResourceNotFoundError):
             gitlab_client._load_repository()
 
-    def test_should_get_pr_info_successfully(
-        self, gitlab_client, mock_mr, mock_project
-    ):
-        gitlab_client._repo = mock_project
-        mock_project.mergerequests.get.return_value = mock_mr
+    def test_should_get_pr_info_successfully(self, gitlab_client_with_mr):
+        gitlab_client, _, mock_project = gitlab_client_with_mr
 
         result = gitlab_client.get_pr_info("123")
 
@@ -139,9 +188,8 @@ class TestGitLabClient:
         assert result.author_username == "testuser"
         mock_project.mergerequests.get.assert_called_once_with(123)
 
-    def test_should_cache_pr_info(self, gitlab_client, mock_mr, mock_project):
-        gitlab_client._repo = mock_project
-        mock_project.mergerequests.get.return_value = mock_mr
+    def test_should_cache_pr_info(self, gitlab_client_with_mr):
+        gitlab_client, _, mock_project = gitlab_client_with_mr
 
         result1 = gitlab_client.get_pr_info("123")
         result2 = gitlab_client.get_pr_info("123")
@@ -149,11 +197,8 @@ class TestGitLabClient:
         assert result1 == result2
         mock_project.mergerequests.get.assert_called_once()
 
-    def test_should_get_diff_data_successfully(
-        self, gitlab_client, mock_mr, mock_project
-    ):
-        gitlab_client._repo = mock_project
-        mock_project.mergerequests.get.return_value = mock_mr
+    def test_should_get_diff_data_successfully(self, gitlab_client_with_mr):
+        gitlab_client, mock_mr, _ = gitlab_client_with_mr
 
         mock_changes = {
             "changes": [
@@ -181,40 +226,23 @@ class TestGitLabClient:
         mock_mr.changes.assert_called_once()
 
     def test_should_limit_files_in_diff_data(
-        self, gitlab_client, mock_mr, mock_project
+        self, gitlab_client_with_mr, oversized_changes
     ):
-        gitlab_client._repo = mock_project
-        mock_project.mergerequests.get.return_value = mock_mr
-
-        changes = []
-        for i in range(GitLabClient.MAX_FILES_PER_MR + 100):
-            changes.append(
-                {
-                    "old_path": f"file{i}.py",
-                    "new_path": f"file{i}.py",
-                    "new_file": False,
-                    "deleted_file": False,
-                    "renamed_file": False,
-                    "diff": "some diff",
-                }
-            )
+        gitlab_client, mock_mr, _ = gitlab_client_with_mr
 
-        mock_mr.changes.return_value = {"changes": changes}
+        mock_mr.changes.return_value = {"changes": oversized_changes}
 
         result = gitlab_client.get_diff_data("123")
 
         assert len(result.files) == GitLabClient.MAX_FILES_PER_MR
 
-    def test_should_get_commit_messages_successfully(
-        self, gitlab_client, mock_mr, mock_project
-    ):
-        gitlab_client._repo = mock_project
-        mock_project.mergerequests.get.return_value = mock_mr
+    def test_should_get_commit_messages_successfully(self, gitlab_client_with_mr):
+        gitlab_client, mock_mr, _ = gitlab_client_with_mr
 
         mock_commits = [
-            MagicMock(message="feat: add feature"),
-            MagicMock(message="fix: bug fix"),
-            MagicMock(message="docs: update readme"),
+            Commit("feat: add feature"),
+            Commit("fix: bug fix"),
+            Commit("docs: update readme"),
         ]
         mock_mr.commits.return_value = mock_commits
 
@@ -225,25 +253,19 @@ class TestGitLabClient:
         assert result[1] == "fix: bug fix"
         assert result[2] == "docs: update readme"
 
-    def test_should_limit_commit_messages(self, gitlab_client, mock_mr, mock_project):
-        gitlab_client._repo = mock_project
-        mock_project.mergerequests.get.return_value = mock_mr
-
-        mock_commits = []
-        for i in range(GitLabClient.MAX_COMMITS_PER_MR + 100):
-            mock_commits.append(MagicMock(message=f"commit {i}"))
+    def test_should_limit_commit_messages(
+        self, gitlab_client_with_mr, oversized_commits
+    ):
+        gitlab_client, mock_mr, _ = gitlab_client_with_mr
 
-        mock_mr.commits.return_value = mock_commits
+        mock_mr.commits.return_value = oversized_commits
 
         result = gitlab_client.get_commit_messages("123")
 
         assert len(result) == GitLabClient.MAX_COMMITS_PER_MR
 
-    def test_should_get_pr_context_successfully(
-        self, gitlab_client, mock_mr, mock_project
-    ):
-        gitlab_client._repo = mock_project
-        mock_project.mergerequests.get.return_value = mock_mr
+    def test_should_get_pr_context_successfully(self, gitlab_client_with_mr):
+        gitlab_client, _, _ = gitlab_client_with_mr
 
         result = gitlab_client.get_pr_context("123")
 
@@ -253,21 +275,18 @@ class TestGitLabClient:
         assert result["work_in_progress"] == "False"
         assert result["pipeline_status"] == "success"
 
-    def test_should_get_existing_comments_successfully(
-        self, gitlab_client, mock_mr, mock_project
-    ):
-        gitlab_client._repo = mock_project
-        mock_project.mergerequests.get.return_value = mock_mr
+    def test_should_get_existing_comments_successfully(self, gitlab_client_with_mr):
+        gitlab_client, mock_mr, _ = gitlab_client_with_mr
 
         mock_notes = [
-            MagicMock(
+            SimpleNamespace(
                 id=1,
                 author={"username": "user1"},
                 body="First comment",
                 created_at="2024-01-01T10:00:00Z",
                 updated_at="2024-01-01T11:00:00Z",
             ),
-            MagicMock(
+            SimpleNamespace(
                 id=2,
                 author={"username": "user2"},
                 body="Second comment with drift",
@@ -275,10 +294,8 @@ class TestGitLabClient:
                 updated_at=None,
             ),
         ]
-        mock_mr.notes.list.side_effect = (
-            lambda **kwargs: mock_notes if kwargs.get("page", 1) == 1 else []
-        )
-        mock_mr.discussions.list.side_effect = lambda **kwargs: []
+        mock_mr.notes.list.side_effect = _paginate(mock_notes)
+        mock_mr.discussions.list.side_effect = _paginate([])
 
         result = gitlab_client.get_existing_comments("123")
 
@@ -288,35 +305,33 @@ class TestGitLabClient:
         assert result[0].body == "First comment"
         assert result[1].is_drift_comment is True
 
-    def test_should_get_discussion_comments(self, gitlab_client, mock_mr, mock_project):
-        gitlab_client._repo = mock_project
-        mock_project.mergerequests.get.return_value = mock_mr
-
-        mock_mr.notes.list.side_effect = lambda **kwargs: []
-
-        mock_discussion = MagicMock()
-        mock_discussion.attributes = {
-            "notes": [
-                {
-                    "id": 3,
-                    "author": {"username": "user3"},
-                    "body": "Diff comment",
-                    "created_at": "2024-01-01T13:00:00Z",
-                    "updated_at": None,
-                    "position": {
-                        "new_path": "file.py",
-                        "old_path": "file.py",
-                        "new_line": 10,
-                        "old_line": None,
-                    },
-                }
-            ]
-        }
-
-        mock_mr.discussions.list.side_effect = (
-            lambda **kwargs: [mock_discussion] if kwargs.get("page", 1) == 1 else []
+    def test_should_get_discussion_comments(self, gitlab_client_with_mr):
+        gitlab_client, mock_mr, _ = gitlab_client_with_mr
+
+        mock_mr.notes.list.side_effect = _paginate([])
+
+        mock_discussion = SimpleNamespace(
+            attributes={
+                "notes": [
+                    {
+                        "id": 3,
+                        "author": {"username": "user3"},
+                        "body": "Diff comment",
+                        "created_at": "2024-01-01T13:00:00Z",
+                        "updated_at": None,
+                        "position": {
+                            "new_path": "file.py",
+                            "old_path": "file.py",
+                            "new_line": 10,
+                            "old_line": None,
+                        },
+                    }
+                ]
+            }
         )
 
+        mock_mr.discussions.list.side_effect = _paginate([mock_discussion])
+
         result = gitlab_client.get_existing_comments("123")
 
         assert len(result) == 1
@@ -324,21 +339,18 @@ class TestGitLabClient:
         assert result[0].line_from == 10
         assert result[0].line_to == 10
 
-    def test_should_post_comment_successfully(
-        self, gitlab_client, mock_mr, mock_project
-    ):
-        gitlab_client._repo = mock_project
-        mock_project.mergerequests.get.return_value = mock_mr
+    def test_should_post_comment_successfully(self, gitlab_client_with_mr):
+        gitlab_client, mock_mr, _ = gitlab_client_with_mr
 
         gitlab_client.post_comment("123", "Test comment")
 
         mock_mr.notes.create.assert_called_once_with({"body": "Test comment"})
 
     def test_should_validate_empty_comment(self, gitlab_client):
-        with pytest.raises(ValueError, match="Comment cannot be empty"):
+        with pytest.raises(ValueError, match=ERR_EMPTY_COMMENT):
             gitlab_client.post_comment("123", "")
 
-        with pytest.raises(ValueError, match="Comment cannot be empty"):
+        with pytest.raises(ValueError, match=ERR_EMPTY_COMMENT):
             gitlab_client.post_comment("123", "   ")
 
     def test_should_validate_long_comment(self, gitlab_client):
@@ -346,13 +358,10 @@ class TestGitLabClient:
         with pytest.raises(ValueError, match="Comment is too long"):
             gitlab_client.post_comment("123", long_comment)
 
-    def test_should_update_comment_successfully(
-        self, gitlab_client, mock_mr, mock_project
-    ):
-        gitlab_client._repo = mock_project
-        mock_project.mergerequests.get.return_value = mock_mr
+    def test_should_update_comment_successfully(self, gitlab_client_with_mr):
+        gitlab_client, mock_mr, _ = gitlab_client_with_mr
 
-        mock_note = MagicMock()
+        mock_note = Mock()
         mock_mr.notes.get.return_value = mock_note
 
         gitlab_client.update_comment("123", "456", "Updated comment")
@@ -387,8 +396,8 @@ class TestGitLabClient:
         assert "[REDACTED]" in sanitized
         assert sanitized.count("[REDACTED]") == 2
 
-    def test_should_handle_api_errors(self, gitlab_client, mock_project):
-        gitlab_client._repo = mock_project
+    def test_should_handle_api_errors(self, gitlab_client_with_mr):
+        gitlab_client, _, mock_project = gitlab_client_with_mr
         mock_project.mergerequests.get.side_effect = Exception("API error")
 
         with pytest.raises(APIError) as exc_info:
@@ -396,37 +405,27 @@ class TestGitLabClient:
 
         assert "Failed to get MR info" in str(exc_info.value)
 
-    def test_should_prevent_memory_exhaustion_attack(
-        self, gitlab_client, mock_mr, mock_project
-    ):
-        gitlab_client._repo = mock_project
-        mock_project.mergerequests.get.return_value = mock_mr
+    def test_should_prevent_memory_exhaustion_attack(self, gitlab_client_with_mr):
+        gitlab_client, mock_mr, _ = gitlab_client_with_mr
 
         original_limit = gitlab_client.MAX_MEMORY_PER_REQUEST
         gitlab_client.MAX_MEMORY_PER_REQUEST = 10 * 1024  # 10KB for testing
 
         try:
             # Create many notes
-            mock_notes = []
-            for i in range(100):
-                mock_note = MagicMock(
+            mock_notes = [
+                SimpleNamespace(
                     id=i,
                     author={"username": f"user{i}"},
                     body="Test comment",
                     created_at="2024-01-01T10:00:00Z",
                     updated_at=None,
                 )
-                mock_notes.append(mock_note)
-
-            def mock_list(**kwargs):
-                page = kwargs.get("page", 1)
-                per_page = kwargs.get("per_page", 100)
-                start = (page - 1) * per_page
-                end = start + per_page
-                return mock_notes[start:end] if start < len(mock_notes) else []
+                for i in range(100)
+            ]
 
-            mock_mr.notes.list.side_effect = mock_list
-            mock_mr.discussions.list.side_effect = lambda **kwargs: []
+            mock_mr.notes.list.side_effect = _paginate(mock_notes)
+            mock_mr.discussions.list.side_effect = _paginate([])
 
             result = gitlab_client.get_existing_comments("123")
 
@@ -438,8 +437,8 @@ class TestGitLabClient:
             # Restore original memory limit
             gitlab_client.MAX_MEMORY_PER_REQUEST = original_limit
 
-    def test_should_handle_gitlab_transient_errors(self, gitlab_client, mock_project):
-        gitlab_client._repo = mock_project
+    def test_should_handle_gitlab_transient_errors(self, gitlab_client_with_mr):
+        gitlab_client, _, mock_project = gitlab_client_with_mr
 
         gitlab_error = GitlabError("Service Unavailable")
         gitlab_error.response_code = 503
@@ -468,10 +467,8 @@ class TestGitLabClient:
         assert "temporarily unavailable" in str(exc_info.value).lower()
         assert "502" in str(exc_info.value)
 
-    def test_should_handle_gitlab_404_error_in_get_pr_info(
-        self, gitlab_client, mock_project
-    ):
-        gitlab_client._repo = mock_project
+    def test_should_handle_gitlab_404_error_in_get_pr_info(self, gitlab_client_with_mr):
+        gitlab_client, _, mock_project = gitlab_client_with_mr
 
         gitlab_error = GitlabError("Not Found")
         gitlab_error.response_code = 404
@@ -483,8 +480,7 @@ class TestGitLabClient:
         assert "Merge request not found" in str(exc_info.value)
 
     def test_should_estimate_object_size_with_dict(self, gitlab_client):
-        mock_obj = MagicMock()
-        mock_obj.__dict__ = {"data": "x" * 1000, "id": 123}
+        mock_obj = SimpleNamespace(data="x" * 1000, id=123)
 
         size = gitlab_client._estimate_object_size(mock_obj)
 
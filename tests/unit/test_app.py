@@ -5,10 +5,9 @@ import pytest
 from drift.app import ConfigAdapter, DriftApplication
 from drift.client import GitProvider
 from drift.config import DriftConfig
-from drift.models import Comment, DiffData, PullRequestInfo
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def drift_config():
     return DriftConfig(
         provider=GitProvider.GITHUB,
@@ -25,21 +24,31 @@ def drift_config():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def config_adapter(drift_config):
     return ConfigAdapter(drift_config)
 
 
-@pytest.fixture
-def mock_client():
-    client = MagicMock()
-    client.get_pr_info.return_value = MagicMock(spec=PullRequestInfo)
-    client.get_diff_data.return_value = MagicMock(spec=DiffData)
+def _configure_client(client):
+    client.get_pr_info.return_value = object()
+    client.get_diff_data.return_value = object()
     client.get_commit_messages.return_value = ["feat: add feature", "fix: bug fix"]
-    client.get_existing_comments.return_value = [MagicMock(spec=Comment)]
+    client.get_existing_comments.return_value = [object()]
     return client
 
 
+@pytest.fixture(scope="module")
+def mock_client():
+    return _configure_client(MagicMock())
+
+
+@pytest.fixture(autouse=True)
+def _reset_client(mock_client):
+    yield
+    mock_client.reset_mock(return_value=True, side_effect=True)
+    _configure_client(mock_client)
+
+
 def test_should_adapt_drift_config_to_client_config(config_adapter, drift_config):
     assert config_adapter.provider == drift_config.provider
     assert config_adapter.token == drift_config.token
@@ -61,23 +70,6 @@ def test_should_create_logger_from_config(config_adapter, drift_config):
     assert logger.name == "drift"
 
 
-@patch("drift.app.GitClientFactory")
-def test_should_create_client_using_factory(mock_factory, drift_config):
-    mock_client = MagicMock()
-    mock_factory.create.return_value = mock_client
-
-    app = DriftApplication(drift_config)
-    client = app.client
-
-    assert client == mock_client
-    mock_factory.create.assert_called_once()
-
-    # Should reuse the same client on subsequent calls
-    client2 = app.client
-    assert client2 == mock_client
-    assert mock_factory.create.call_count == 1
-
-
 @patch("drift.app.DriftConfig")
 def test_should_create_app_from_env(mock_config_class):
     mock_config = MagicMock()
@@ -100,41 +92,62 @@ def test_should_create_app_from_file(mock_config_class):
     mock_config_class.from_file.assert_called_once_with("/path/to/config.yaml")
 
 
-@patch("drift.app.GitClientFactory")
-def test_should_analyze_pr(mock_factory, drift_config, mock_client):
-    mock_factory.create.return_value = mock_client
+@pytest.fixture(scope="class")
+def mock_factory():
+    with patch("drift.app.GitClientFactory") as mock:
+        yield mock
 
-    app = DriftApplication(drift_config)
-    result = app.analyze_pr("123")
 
-    assert "pr_info" in result
-    assert "diff_data" in result
-    assert "commits" in result
-    assert "comments" in result
+class TestDriftApplication:
+    @pytest.fixture(autouse=True)
+    def _reset_factory(self, mock_factory):
+        mock_factory.reset_mock(return_value=True, side_effect=True)
 
-    mock_client.get_pr_info.assert_called_once_with("123")
-    mock_client.get_diff_data.assert_called_once_with("123")
-    mock_client.get_commit_messages.assert_called_once_with("123")
-    mock_client.get_existing_comments.assert_called_once_with("123")
+    def test_should_create_client_using_factory(self, mock_factory, drift_config):
+        mock_client = MagicMock()
+        mock_factory.create.return_value = mock_client
 
+        app = DriftApplication(drift_config)
+        client = app.client
 
-@patch("drift.app.GitClientFactory")
-def test_should_post_review(mock_factory, drift_config, mock_client):
-    mock_factory.create.return_value = mock_client
+        assert client == mock_client
+        mock_factory.create.assert_called_once()
 
-    app = DriftApplication(drift_config)
-    app.post_review("123", "Great work!")
+        # Should reuse the same client on subsequent calls
+        client2 = app.client
+        assert client2 == mock_client
+        assert mock_factory.create.call_count == 1
 
-    mock_client.post_comment.assert_called_once_with("123", "Great work!")
+    def test_should_analyze_pr(self, mock_factory, drift_config, mock_client):
+        mock_factory.create.return_value = mock_client
 
+        app = DriftApplication(drift_config)
+        result = app.analyze_pr("123")
 
-@patch("drift.app.GitClientFactory")
-def test_should_update_review(mock_factory, drift_config, mock_client):
-    mock_factory.create.return_value = mock_client
+        assert result["pr_info"] is mock_client.get_pr_info.return_value
+        assert result["diff_data"] is mock_client.get_diff_data.return_value
+        assert result["commits"] == ["feat: add feature", "fix: bug fix"]
+        assert result["comments"] == mock_client.get_existing_comments.return_value
 
-    app = DriftApplication(drift_config)
-    app.update_review("123", "comment-456", "Updated: Great work!")
+        mock_client.get_pr_info.assert_called_once_with("123")
+        mock_client.get_diff_data.assert_called_once_with("123")
+        mock_client.get_commit_messages.assert_called_once_with("123")
+        mock_client.get_existing_comments.assert_called_once_with("123")
 
-    mock_client.update_comment.assert_called_once_with(
-        "123", "comment-456", "Updated: Great work!"
-    )
+    def test_should_post_review(self, mock_factory, drift_config, mock_client):
+        mock_factory.create.return_value = mock_client
+
+        app = DriftApplication(drift_config)
+        app.post_review("123", "Great work!")
+
+        mock_client.post_comment.assert_called_once_with("123", "Great work!")
+
+    def test_should_update_review(self, mock_factory, drift_config, mock_client):
+        mock_factory.create.return_value = mock_client
+
+        app = DriftApplication(drift_config)
+        app.update_review("123", "comment-456", "Updated: Great work!")
+
+        mock_client.update_comment.assert_called_once_with(
+            "123", "comment-456", "Updated: Great work!"
+        )
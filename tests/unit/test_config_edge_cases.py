@@ -1,5 +1,5 @@
 import os
-import tempfile
+from types import MappingProxyType
 from unittest.mock import patch
 
 import pytest
@@ -9,146 +9,145 @@ from drift.config import DriftConfig
 from drift.exceptions import ConfigurationError
 
 
-def test_should_raise_error_when_env_vars_contain_invalid_numbers() -> None:
-    env_vars = {
+try:
+    from yaml import CSafeDumper as SafeDumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper  # type: ignore[assignment]
+
+
+BASE_ENV = MappingProxyType(
+    {
         "DRIFT_PROVIDER": "github",
         "GITHUB_TOKEN": "test_token",
         "DRIFT_REPO": "owner/repo",
     }
-
-    # Test invalid integer in DRIFT_CACHE_TTL
-    env_vars["DRIFT_CACHE_TTL"] = "not-a-number"
-    with patch.dict(os.environ, env_vars, clear=True):
-        with pytest.raises(
-            ConfigurationError, match="Invalid integer value for DRIFT_CACHE_TTL"
-        ):
-            DriftConfig.from_env()
-
-    # Test invalid integer in DRIFT_MAX_RETRIES
-    env_vars["DRIFT_CACHE_TTL"] = "300"
-    env_vars["DRIFT_MAX_RETRIES"] = "3.14"  # Float when expecting int
-    with patch.dict(os.environ, env_vars, clear=True):
-        with pytest.raises(
-            ConfigurationError, match="Invalid integer value for DRIFT_MAX_RETRIES"
-        ):
-            DriftConfig.from_env()
-
-    # Test invalid float in DRIFT_BACKOFF_FACTOR
-    env_vars["DRIFT_MAX_RETRIES"] = "3"
-    env_vars["DRIFT_BACKOFF_FACTOR"] = "not.a.float"
-    with patch.dict(os.environ, env_vars, clear=True):
-        with pytest.raises(
-            ConfigurationError, match="Invalid float value for DRIFT_BACKOFF_FACTOR"
-        ):
+)
+
+
+@pytest.mark.parametrize(
+    ("name", "value", "message"),
+    [
+        (
+            "DRIFT_CACHE_TTL",
+            "not-a-number",
+            "Invalid integer value for DRIFT_CACHE_TTL",
+        ),
+        # Float when expecting int
+        ("DRIFT_MAX_RETRIES", "3.14", "Invalid integer value for DRIFT_MAX_RETRIES"),
+        (
+            "DRIFT_BACKOFF_FACTOR",
+            "not.a.float",
+            "Invalid float value for DRIFT_BACKOFF_FACTOR",
+        ),
+        # Has unit suffix
+        ("DRIFT_TIMEOUT", "30s", "Invalid integer value for DRIFT_TIMEOUT"),
+        (
+            "DRIFT_CONNECTION_POOL_SIZE",
+            "ten",
+            "Invalid integer value for DRIFT_CONNECTION_POOL_SIZE",
+        ),
+    ],
+)
+def test_should_raise_error_when_env_vars_contain_invalid_numbers(
+    name: str, value: str, message: str
+) -> None:
+    with patch.dict(os.environ, {**BASE_ENV, name: value}, clear=True):
+        with pytest.raises(ConfigurationError, match=message):
             DriftConfig.from_env()
 
-    # Test invalid integer in DRIFT_TIMEOUT
-    env_vars["DRIFT_BACKOFF_FACTOR"] = "1.0"
-    env_vars["DRIFT_TIMEOUT"] = "30s"  # Has unit suffix
-    with patch.dict(os.environ, env_vars, clear=True):
-        with pytest.raises(
-            ConfigurationError, match="Invalid integer value for DRIFT_TIMEOUT"
-        ):
-            DriftConfig.from_env()
 
-    # Test invalid integer in DRIFT_CONNECTION_POOL_SIZE
-    env_vars["DRIFT_TIMEOUT"] = "30"
-    env_vars["DRIFT_CONNECTION_POOL_SIZE"] = "ten"
-    with patch.dict(os.environ, env_vars, clear=True):
-        with pytest.raises(
-            ConfigurationError,
-            match="Invalid integer value for DRIFT_CONNECTION_POOL_SIZE",
-        ):
-            DriftConfig.from_env()
-
-
-def test_should_use_defaults_when_env_vars_are_empty_strings() -> None:
+@pytest.fixture(scope="module")
+def default_config() -> DriftConfig:
+    # Empty strings should fall back to the defaults
     env_vars = {
-        "DRIFT_PROVIDER": "github",
-        "GITHUB_TOKEN": "test_token",
-        "DRIFT_REPO": "owner/repo",
-        "DRIFT_CACHE_TTL": "",  # Empty string should use default
+        **BASE_ENV,
+        "DRIFT_CACHE_TTL": "",
         "DRIFT_MAX_RETRIES": "",
         "DRIFT_BACKOFF_FACTOR": "",
         "DRIFT_TIMEOUT": "",
         "DRIFT_CONNECTION_POOL_SIZE": "",
     }
-
     with patch.dict(os.environ, env_vars, clear=True):
-        config = DriftConfig.from_env()
-
-    # Should use all defaults
-    assert config.cache_ttl == 300
-    assert config.max_retries == 3
-    assert config.backoff_factor == 1.0
-    assert config.timeout == 30
-    assert config.connection_pool_size == 10
-
-
-def test_should_detect_unexpanded_env_vars_in_token() -> None:
+        return DriftConfig.from_env()
+
+
+@pytest.mark.parametrize(
+    ("attr", "expected"),
+    [
+        ("cache_ttl", 300),
+        ("max_retries", 3),
+        ("backoff_factor", 1.0),
+        ("timeout", 30),
+        ("connection_pool_size", 10),
+    ],
+)
+def test_should_use_defaults_when_env_vars_are_empty_strings(
+    default_config: DriftConfig, attr: str, expected: float
+) -> None:
+    assert getattr(default_config, attr) == expected
+
+
+def _write_token_config(
+    tmp_path_factory: pytest.TempPathFactory, name: str, token: str
+) -> str:
     config_data = {
         "provider": "github",
         "repository": "owner/repo",
-        "authentication": {"token": "${UNDEFINED_TOKEN}"},
+        "authentication": {"token": token},
     }
+    config_file = tmp_path_factory.mktemp("config") / name
+    config_file.write_text(yaml.dump(config_data, Dumper=SafeDumper))
+    return str(config_file)
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".yml", delete=False) as tmp:
-        yaml.dump(config_data, tmp)
-        tmp_path = tmp.name
 
-    try:
-        # Undefined variable should be detected
-        with pytest.raises(
-            ConfigurationError,
-            match="Token configuration error: Environment variable not found",
-        ):
-            DriftConfig.from_file(tmp_path)
-    finally:
-        os.unlink(tmp_path)
+@pytest.fixture(scope="session")
+def undefined_token_config(tmp_path_factory: pytest.TempPathFactory) -> str:
+    return _write_token_config(tmp_path_factory, "undef.yml", "${UNDEFINED_TOKEN}")
 
-    # Test with partially expanded variable
-    config_data["authentication"]["token"] = "prefix_${UNDEFINED}_suffix"
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".yml", delete=False) as tmp:
-        yaml.dump(config_data, tmp)
-        tmp_path = tmp.name
+@pytest.fixture(scope="session")
+def partial_expand_config(tmp_path_factory: pytest.TempPathFactory) -> str:
+    return _write_token_config(
+        tmp_path_factory, "partial.yml", "prefix_${UNDEFINED}_suffix"
+    )
 
-    try:
-        with pytest.raises(
-            ConfigurationError,
-            match="Token configuration error: Environment variable not found",
-        ):
-            DriftConfig.from_file(tmp_path)
-    finally:
-        os.unlink(tmp_path)
 
+@pytest.fixture(scope="session")
+def special_token_config(tmp_path_factory: pytest.TempPathFactory) -> str:
+    return _write_token_config(tmp_path_factory, "special.yml", "${SPECIAL_TOKEN}")
 
-def test_should_handle_special_characters_in_expanded_token() -> None:
-    config_data = {
-        "provider": "github",
-        "repository": "owner/repo",
-        "authentication": {"token": "${SPECIAL_TOKEN}"},
-    }
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".yml", delete=False) as tmp:
-        yaml.dump(config_data, tmp)
-        tmp_path = tmp.name
+def test_should_detect_unexpanded_env_vars_in_token(
+    undefined_token_config: str, partial_expand_config: str
+) -> None:
+    # Undefined variable should be detected
+    with pytest.raises(
+        ConfigurationError,
+        match="Token configuration error: Environment variable not found",
+    ):
+        DriftConfig.from_file(undefined_token_config)
+
+    # Test with partially expanded variable
+    with pytest.raises(
+        ConfigurationError,
+        match="Token configuration error: Environment variable not found",
+    ):
+        DriftConfig.from_file(partial_expand_config)
 
-    try:
-        # Test with token containing special characters
-        special_token = "ghp_abc123!@#$%^&*()_+-=[]{}|;:',.<>?/~`"
-        with patch.dict(os.environ, {"SPECIAL_TOKEN": special_token}):
-            config = DriftConfig.from_file(tmp_path)
-            assert config.token == special_token
-    finally:
-        os.unlink(tmp_path)
+
+def test_should_handle_special_characters_in_expanded_token(
+    special_token_config: str,
+) -> None:
+    # Test with token containing special characters
+    special_token = "ghp_abc123!@#$%^&*()_+-=[]{}|;:',.<>?/~`"
+    with patch.dict(os.environ, {"SPECIAL_TOKEN": special_token}):
+        config = DriftConfig.from_file(special_token_config)
+        assert config.token == special_token
 
 
 def test_should_handle_edge_case_numeric_values() -> None:
     env_vars = {
-        "DRIFT_PROVIDER": "github",
-        "GITHUB_TOKEN": "test_token",
-        "DRIFT_REPO": "owner/repo",
+        **BASE_ENV,
         "DRIFT_CACHE_TTL": "0",  # Zero should be valid
         "DRIFT_MAX_RETRIES": "0",  # Zero retries
         "DRIFT_BACKOFF_FACTOR": "0.0",  # Zero backoff
@@ -1,3 +1,6 @@
+import copy
+import pickle
+
 import pytest
 
 from drift.exceptions import (
@@ -67,3 +70,18 @@ def test_should_inherit_from_drift_exception_when_using_custom_exceptions() -> N
         instance = exc_class("test")
         assert isinstance(instance, DriftException)
         assert isinstance(instance, Exception)
+
+
+@pytest.mark.parametrize(
+    "duplicate",
+    [copy.copy, lambda error: pickle.loads(pickle.dumps(error))],
+    ids=["copy", "pickle"],
+)
+def test_should_keep_fields_when_exceptions_are_copied_or_pickled(duplicate) -> None:
+    rate_limit = duplicate(RateLimitError(42, "rate limited"))
+    assert rate_limit.reset_time == 42
+    assert "rate limited" in str(rate_limit)
+
+    api_error = duplicate(APIError(500, "boom"))
+    assert api_error.status_code == 500
+    assert api_error.message == "boom"
@@ -0,0 +1,95 @@
+import logging
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from drift import logger as drift_logger
+from drift.logger import _DriftFormatter, get_logger, setup_logging
+
+
+DATEFMT = "%Y-%m-%d %H:%M:%S"
+
+
+def _make_record(created: float) -> logging.LogRecord:
+    record = logging.LogRecord("drift.test", logging.INFO, __file__, 1, "msg", (), None)
+    record.created = created
+    return record
+
+
+@pytest.fixture
+def mock_strftime(monkeypatch: pytest.MonkeyPatch) -> Mock:
+    strftime = Mock(wraps=time.strftime)
+    monkeypatch.setattr("drift.logger.time.strftime", strftime)
+    return strftime
+
+
+def test_should_reuse_timestamp_for_records_in_same_second(
+    mock_strftime: Mock,
+) -> None:
+    formatter = _DriftFormatter(datefmt=DATEFMT)
+
+    first = formatter.formatTime(_make_record(1_700_000_000.1))
+    second = formatter.formatTime(_make_record(1_700_000_000.9))
+
+    assert first == second
+    assert mock_strftime.call_count == 1
+
+
+def test_should_refresh_timestamp_when_second_changes(mock_strftime: Mock) -> None:
+    formatter = _DriftFormatter(datefmt=DATEFMT)
+    expected = logging.Formatter().formatTime(_make_record(1_700_000_001.5), DATEFMT)
+    mock_strftime.reset_mock()
+
+    first = formatter.formatTime(_make_record(1_700_000_000.5))
+    second = formatter.formatTime(_make_record(1_700_000_001.5))
+
+    assert first != second
+    assert second == expected
+    assert mock_strftime.call_count == 2
+
+
+def test_should_not_reuse_timestamp_when_datefmt_differs_in_same_second() -> None:
+    formatter = _DriftFormatter(datefmt=DATEFMT)
+    record = _make_record(1_700_000_000.5)
+
+    default = formatter.formatTime(record)
+    date_only = formatter.formatTime(record, "%Y-%m-%d")
+
+    assert date_only == logging.Formatter().formatTime(record, "%Y-%m-%d")
+    assert date_only != default
+    assert formatter.formatTime(record) == default
+
+
+def test_should_use_default_formatting_when_no_datefmt_is_set(
+    mock_strftime: Mock,
+) -> None:
+    formatter = _DriftFormatter()
+    record = _make_record(1_700_000_000.25)
+
+    assert formatter.formatTime(record) == logging.Formatter().formatTime(record)
+    assert formatter._time_cache == (-1, "", "")
+
+
+def test_should_install_one_handler_and_apply_new_level_when_setup_twice(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(drift_logger, "_configured", False)
+    logger = logging.getLogger("drift")
+    original_level = logger.level
+
+    try:
+        setup_logging("INFO")
+        setup_logging("DEBUG")
+
+        assert len(logger.handlers) == 1
+        assert logger.level == logging.DEBUG
+    finally:
+        logger.setLevel(original_level)
+
+
+def test_should_return_same_logger_when_get_logger_called_with_same_name() -> None:
+    first = get_logger("test_logger")
+
+    assert get_logger("test_logger") is first
+    assert first.name == "drift.test_logger"
@@ -1,10 +1,27 @@
 import json
 import logging
+import sys
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from drift.__main__ import main, setup_logging
 
 
+@pytest.fixture
+def mock_app_class(monkeypatch):
+    app_class = MagicMock()
+    monkeypatch.setattr("drift.__main__.DriftApplication", app_class)
+    return app_class
+
+
+@pytest.fixture
+def mock_validator(monkeypatch):
+    validator = MagicMock()
+    monkeypatch.setattr("drift.__main__.SecurityValidator", validator)
+    return validator
+
+
 def test_should_setup_json_logging(caplog):
     with caplog.at_level(logging.INFO):
         setup_logging("INFO", "json")
@@ -28,9 +45,8 @@ def test_should_setup_text_logging(caplog):
     assert record.levelname == "DEBUG"
 
 
-@patch("drift.__main__.DriftApplication")
-@patch("sys.argv", ["drift", "test"])
-def test_should_test_configuration_from_env(mock_app_class):
+def test_should_test_configuration_from_env(mock_app_class, monkeypatch):
+    monkeypatch.setattr(sys, "argv", ["drift", "test"])
     mock_app = MagicMock()
     mock_app.config.provider = "github"
     mock_app.config.repo = "owner/repo"
@@ -39,17 +55,15 @@ def test_should_test_configuration_from_env(mock_app_class):
     mock_app.client.__class__.__name__ = "GitHubClient"
     mock_app_class.from_env.return_value = mock_app
 
-    with patch("sys.exit") as mock_exit:
-        main()
-        mock_exit.assert_not_called()
+    main()
 
     mock_app_class.from_env.assert_called_once()
 
 
-@patch("drift.__main__.SecurityValidator")
-@patch("drift.__main__.DriftApplication")
-@patch("sys.argv", ["drift", "--config", "config.yaml", "test"])
-def test_should_test_configuration_from_file(mock_app_class, mock_validator):
+def test_should_test_configuration_from_file(
+    mock_app_class, mock_validator, monkeypatch
+):
+    monkeypatch.setattr(sys, "argv", ["drift", "--config", "config.yaml", "test"])
     mock_app = MagicMock()
     mock_app.config.provider = "gitlab"
     mock_app.config.repo = "123"
@@ -62,17 +76,14 @@ def test_should_test_configuration_from_file(mock_app_class, mock_validator):
 
     mock_validator.validate_config_path.return_value = Path("config.yaml")
 
-    with patch("sys.exit") as mock_exit:
-        main()
-        mock_exit.assert_not_called()
+    main()
 
     mock_validator.validate_config_path.assert_called_once_with("config.yaml")
     mock_app_class.from_file.assert_called_once_with("config.yaml")
 
 
-@patch("drift.__main__.DriftApplication")
-@patch("sys.argv", ["drift", "analyze", "123"])
-def test_should_analyze_pr(mock_app_class, capsys):
+def test_should_analyze_pr(mock_app_class, capsys, monkeypatch):
+    monkeypatch.setattr(sys, "argv", ["drift", "analyze", "123"])
     mock_app = MagicMock()
     mock_app.analyze_pr.return_value = {
         "pr_info": {"title": "Test PR"},
@@ -82,9 +93,7 @@ def test_should_analyze_pr(mock_app_class, capsys):
     }
     mock_app_class.from_env.return_value = mock_app
 
-    with patch("sys.exit") as mock_exit:
-        main()
-        mock_exit.assert_not_called()
+    main()
 
     mock_app.analyze_pr.assert_called_once_with("123")
     captured = capsys.readouterr()
@@ -92,10 +101,12 @@ def test_should_analyze_pr(mock_app_class, capsys):
     assert result["pr_info"]["title"] == "Test PR"
 
 
-@patch("drift.__main__.SecurityValidator")
-@patch("drift.__main__.DriftApplication")
-@patch("sys.argv", ["drift", "analyze", "123", "--output", "analysis.json"])
-def test_should_analyze_pr_with_output_file(mock_app_class, mock_validator):
+def test_should_analyze_pr_with_output_file(
+    mock_app_class, mock_validator, monkeypatch
+):
+    monkeypatch.setattr(
+        sys, "argv", ["drift", "analyze", "123", "--output", "analysis.json"]
+    )
     mock_app = MagicMock()
     mock_app.analyze_pr.return_value = {
         "pr_info": {"title": "Test PR"},
@@ -111,9 +122,7 @@ def test_should_analyze_pr_with_output_file(mock_app_class, mock_validator):
     mock_validator.validate_pr_id.return_value = "123"
     mock_validator.validate_output_path.return_value = mock_path
 
-    with patch("sys.exit") as mock_exit:
-        main()
-        mock_exit.assert_not_called()
+    main()
 
     mock_validator.validate_output_path.assert_called_once_with("analysis.json")
     mock_path.write_text.assert_called_once()
@@ -122,37 +131,34 @@ def test_should_analyze_pr_with_output_file(mock_app_class, mock_validator):
     assert written_data["pr_info"]["title"] == "Test PR"
 
 
-@patch("drift.__main__.DriftApplication")
-@patch("sys.argv", ["drift", "comment", "123", "Great work!"])
-def test_should_post_comment(mock_app_class):
+def test_should_post_comment(mock_app_class, monkeypatch):
+    monkeypatch.setattr(sys, "argv", ["drift", "comment", "123", "Great work!"])
     mock_app = MagicMock()
     mock_app_class.from_env.return_value = mock_app
 
-    with patch("sys.exit") as mock_exit:
-        main()
-        mock_exit.assert_not_called()
+    main()
 
     mock_app.post_review.assert_called_once_with("123", "Great work!")
 
 
-@patch("drift.__main__.DriftApplication")
-@patch("sys.argv", ["drift", "update", "123", "comment-456", "Updated comment"])
-def test_should_update_comment(mock_app_class):
+def test_should_update_comment(mock_app_class, monkeypatch):
+    monkeypatch.setattr(
+        sys, "argv", ["drift", "update", "123", "comment-456", "Updated comment"]
+    )
     mock_app = MagicMock()
     mock_app_class.from_env.return_value = mock_app
 
-    with patch("sys.exit") as mock_exit:
-        main()
-        mock_exit.assert_not_called()
+    main()
 
     mock_app.update_review.assert_called_once_with(
         "123", "comment-456", "Updated comment"
     )
 
 
-@patch("drift.__main__.DriftApplication")
-@patch("sys.argv", ["drift", "--log-level", "DEBUG", "--log-format", "text", "test"])
-def test_should_use_custom_log_settings(mock_app_class):
+def test_should_use_custom_log_settings(mock_app_class, monkeypatch):
+    monkeypatch.setattr(
+        sys, "argv", ["drift", "--log-level", "DEBUG", "--log-format", "text", "test"]
+    )
     mock_app = MagicMock()
     mock_app.config.provider = "github"
     mock_app.config.repo = "owner/repo"
@@ -162,69 +168,62 @@ def test_should_use_custom_log_settings(mock_app_class):
     mock_app_class.from_env.return_value = mock_app
 
     with patch("drift.__main__.setup_logging") as mock_setup_logging:
-        with patch("sys.exit") as mock_exit:
-            main()
-            mock_exit.assert_not_called()
+        main()
 
         mock_setup_logging.assert_called_once_with("DEBUG", "text")
 
 
-@patch("drift.__main__.DriftApplication")
-@patch("sys.argv", ["drift"])
-def test_should_print_help_when_no_command(mock_app_class, capsys):
+def test_should_print_help_when_no_command(mock_app_class, capsys, monkeypatch):
+    monkeypatch.setattr(sys, "argv", ["drift"])
     mock_app = MagicMock()
     mock_app_class.from_env.return_value = mock_app
 
-    with patch("sys.exit") as mock_exit:
+    with pytest.raises(SystemExit) as exc_info:
         main()
-        mock_exit.assert_called_once_with(1)
+    assert exc_info.value.code == 1
 
     captured = capsys.readouterr()
     assert "usage:" in captured.out
     assert "Available commands" in captured.out
 
 
-@patch("drift.__main__.DriftApplication")
-@patch("sys.argv", ["drift", "test"])
-def test_should_handle_configuration_error(mock_app_class):
+def test_should_handle_configuration_error(mock_app_class, monkeypatch):
+    monkeypatch.setattr(sys, "argv", ["drift", "test"])
     from drift.exceptions import ConfigurationError
 
     mock_app_class.from_env.side_effect = ConfigurationError("Invalid config")
 
-    with patch("sys.exit") as mock_exit:
+    with pytest.raises(SystemExit) as exc_info:
         main()
-        mock_exit.assert_called_once_with(1)
+    assert exc_info.value.code == 1
 
 
-@patch("drift.__main__.DriftApplication")
-@patch("sys.argv", ["drift", "analyze", "123"])
-def test_should_handle_drift_exception(mock_app_class):
+def test_should_handle_drift_exception(mock_app_class, monkeypatch):
+    monkeypatch.setattr(sys, "argv", ["drift", "analyze", "123"])
     from drift.exceptions import DriftException
 
     mock_app = MagicMock()
     mock_app_class.from_env.return_value = mock_app
     mock_app.analyze_pr.side_effect = DriftException("API error")
 
-    with patch("sys.exit") as mock_exit:
+    with pytest.raises(SystemExit) as exc_info:
         main()
-        mock_exit.assert_called_once_with(1)
+    assert exc_info.value.code == 1
 
 
-@patch("drift.__main__.DriftApplication")
-@patch("sys.argv", ["drift", "test"])
-def test_should_handle_keyboard_interrupt(mock_app_class):
+def test_should_handle_keyboard_interrupt(mock_app_class, monkeypatch):
+    monkeypatch.setattr(sys, "argv", ["drift", "test"])
     mock_app_class.from_env.side_effect = KeyboardInterrupt()
 
-    with patch("sys.exit") as mock_exit:
+    with pytest.raises(SystemExit) as exc_info:
         main()
-        mock_exit.assert_called_once_with(130)
+    assert exc_info.value.code == 130
 
 
-@patch("drift.__main__.DriftApplication")
-@patch("sys.argv", ["drift", "test"])
-def test_should_handle_unexpected_error(mock_app_class):
+def test_should_handle_unexpected_error(mock_app_class, monkeypatch):
+    monkeypatch.setattr(sys, "argv", ["drift", "test"])
     mock_app_class.from_env.side_effect = Exception("Unexpected error")
 
-    with patch("sys.exit") as mock_exit:
+    with pytest.raises(SystemExit) as exc_info:
         main()
-        mock_exit.assert_called_once_with(1)
+    assert exc_info.value.code == 1